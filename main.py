@@ -177,11 +177,12 @@ def compute_synthesis(db, config):
 def generate_ods(db, output_path, config=None, heating_config=None,
                  transport_config=None, industrie_config=None,
                  tertiaire_config=None, agriculture_config=None,
-                 electrification_params=None):
+                 electrification_params=None, sheet_cache_dir=None,
+                 compression='deflate', compresslevel=None):
     """Step 4: Generate ODS file with source sheets and synthesis formulas."""
     print(f"[4/5] Generating ODS: {output_path}")
 
-    writer = ODSWriter()
+    writer = ODSWriter(cache_dir=sheet_cache_dir)
     add_all_source_sheets(
         writer, db,
         config=config,
@@ -193,7 +194,7 @@ def generate_ods(db, output_path, config=None, heating_config=None,
         electrification_params=electrification_params,
     )
     add_synthesis_sheet(writer, db)
-    writer.save(output_path)
+    writer.save(output_path, compresslevel=compresslevel, compression=compression)
 
     import os
     size = os.path.getsize(output_path)
@@ -210,10 +211,18 @@ def main():
                         help='SQLite database path')
     parser.add_argument('--cache-dir', type=str, default='data/cache',
                         help='Download cache directory')
+    parser.add_argument('--sheet-cache-dir', type=str, default=None,
+                        help='Cache serialized data sheets in this directory '
+                             '(default: no sheet cache)')
     parser.add_argument('--skip-download', action='store_true',
                         help='Skip downloading, use existing DB')
     parser.add_argument('--download-only', action='store_true',
                         help='Only download data, do not generate ODS')
+    parser.add_argument('--no-compress', action='store_true',
+                        help='Write the ODS uncompressed (faster, larger file)')
+    parser.add_argument('--compress-level', type=int, default=None, choices=range(1, 10),
+                        metavar='{1-9}',
+                        help='Deflate level (default: zlib default; 1 is faster, larger file)')
     args = parser.parse_args()
 
     config = EnergyModelConfig()
@@ -253,7 +262,10 @@ def main():
                          industrie_config=industrie_config,
                          tertiaire_config=tertiaire_config,
                          agriculture_config=agriculture_config,
-                         electrification_params=electrification_params)
+                         electrification_params=electrification_params,
+                         sheet_cache_dir=args.sheet_cache_dir,
+                         compression='store' if args.no_compress else 'deflate',
+                         compresslevel=args.compress_level)
 
         db.store_metadata('pipeline_end', datetime.now().isoformat())
         db.store_metadata('gas_total_twh', f"{gas_total:.2f}")
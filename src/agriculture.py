@@ -15,6 +15,13 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 
+# Calendar month order
+_MOIS_ORDRE = (
+    'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
+    'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre',
+)
+
+
 @dataclass
 class AgricultureConfig:
     """Agricultural sector energy parameters."""
@@ -305,11 +312,7 @@ def profil_agriculture_normalise(
     if config is None:
         config = AgricultureConfig()
 
-    mois_ordre = (
-        'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
-        'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre',
-    )
-    values = [config.profil_mensuel.get(m, 1.0) for m in mois_ordre]
+    values = [config.profil_mensuel.get(m, 1.0) for m in _MOIS_ORDRE]
     total = sum(values)
     if total == 0:
         return [1 / 12] * 12
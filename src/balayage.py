@@ -0,0 +1,39 @@
+"""
+Parameter sweep support for the Energy Transition Model.
+
+The *_sweep functions run a module's config arithmetic once on NumPy
+arrays of field values, instead of once per config.
+"""
+
+from dataclasses import fields
+from types import SimpleNamespace
+from typing import Dict
+
+import numpy as np
+
+
+def champs_balayage(config, valeurs: Dict[str, np.ndarray], axe_final: bool = False) -> SimpleNamespace:
+    """
+    Fields of a config dataclass, with the swept ones replaced by float arrays.
+
+    Args:
+        config: Configuration supplying the fields not swept
+        valeurs: Field name -> array of values
+        axe_final: Add a trailing length-1 axis to the swept arrays, so they
+            broadcast against a trailing axis of the computation (e.g. years)
+
+    Returns:
+        Namespace with one attribute per constructor field of config
+
+    Raises:
+        TypeError: If a swept name is not a field of config
+    """
+    champs = {f.name: getattr(config, f.name) for f in fields(config) if f.init}
+    inconnus = valeurs.keys() - champs.keys()
+    if inconnus:
+        raise TypeError(
+            f"{type(config).__name__} has no field(s): {', '.join(sorted(inconnus))}")
+    for nom, v in valeurs.items():
+        tableau = np.asarray(v, dtype=np.float64)
+        champs[nom] = tableau[..., np.newaxis] if axe_final else tableau
+    return SimpleNamespace(**champs)
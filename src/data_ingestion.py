@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import List, Optional, Any, Dict
 import pandas as pd
 
-from .temporal import extraire_mois, extraire_plage
+from .temporal import parse_periode
 
 
 # ODF namespaces
@@ -199,8 +199,10 @@ def load_energy_model_data(ods_path: Path) -> pd.DataFrame:
         row_range=(3, 65)
     )
 
-    # Add derived columns
-    df['Mois'] = df['Periode'].apply(extraire_mois)
-    df['Plage'] = df['Periode'].apply(extraire_plage)
+    # Add derived columns, as categoricals so equality filters on them
+    # compare integer codes instead of strings
+    mois, plages = zip(*map(parse_periode, df['Periode']))
+    df['Mois'] = pd.Categorical(mois)
+    df['Plage'] = pd.Categorical(plages)
 
     return df
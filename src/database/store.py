@@ -223,6 +223,33 @@ class EnergyModelDB:
         )
         return [dict(row) for row in cursor.fetchall()]
 
+    def load_synthesis_columns(self, slots):
+        """Load synthesis as one list per value column, in the given slot order.
+
+        Args:
+            slots: Sequence of (mois, plage) pairs giving the list order
+
+        Returns:
+            Dict mapping column name to a list aligned with slots (0.0 for
+            slots absent from the table), or {} if the table is empty.
+        """
+        cursor = self.conn.execute("SELECT * FROM synthese_moulinette")
+        rows = cursor.fetchall()
+        if not rows:
+            return {}
+
+        names = [d[0] for d in cursor.description][2:]
+        index = {slot: i for i, slot in enumerate(slots)}
+        columns = {name: [0.0] * len(slots) for name in names}
+        col_lists = [columns[name] for name in names]
+        for row in rows:
+            i = index.get((row[0], row[1]))
+            if i is None:
+                continue
+            for col, value in zip(col_lists, tuple(row)[2:]):
+                col[i] = value
+        return columns
+
     def store_metadata(self, key, value):
         """Store a metadata key-value pair."""
         self.conn.execute(
@@ -50,6 +50,24 @@ def calculer_energie_twh(
     return deficit_kw * duree_h * jours / 1e9
 
 
+def facteur_energie_twh(config: Optional[EnergyModelConfig] = None) -> float:
+    """
+    Factor turning kW x hours/day into TWh/month: days_per_month / 1e9.
+
+    Vectorized callers multiply whole deficit x duration arrays by this
+    once instead of calling calculer_energie_twh per slot.
+
+    Args:
+        config: Model configuration (uses DEFAULT_CONFIG if None)
+
+    Returns:
+        TWh per (kW x h/day)
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    return config.temporal.jours_par_mois / 1e9
+
+
 def calculer_deficit_kw(production_kw: float, consommation_kw: float) -> float:
     """
     Calculate power deficit (gas backup need).
@@ -9,15 +9,17 @@ import pandas as pd
 import numpy as np
 
 from .config import EnergyModelConfig, DEFAULT_CONFIG
+from .production import NightSlot, extract_night_data
 from .sensitivity import calculate_gas_need_no_storage, calculate_gas_need_with_storage
-from .storage import calculate_storage_need
+from .storage import calculate_daily_balance, calculate_storage_need
 
 
 def calculate_scenario_costs(
     extra_solar_gwc: float,
     solar_cf: Dict[Tuple[str, str], Dict],
     df: pd.DataFrame,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> Dict[str, float]:
     """
     Calculate costs for a given solar capacity scenario.
@@ -27,6 +29,8 @@ def calculate_scenario_costs(
         solar_cf: Capacity factor data
         df: Original DataFrame
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
         Dict with cost breakdown:
@@ -44,13 +48,20 @@ def calculate_scenario_costs(
 
     baseline = config.production.solar_capacity_gwc
     total_solar = max(0, baseline + extra_solar_gwc)
+    if night is None:
+        night = extract_night_data(df)
+
+    # Daily surplus/deficit, shared by the gas need and the storage requirement
+    balance = calculate_daily_balance(extra_solar_gwc, solar_cf, night, config)
 
     # Gas need with storage
-    gas_need = calculate_gas_need_with_storage(extra_solar_gwc, solar_cf, df, config)
+    gas_need = calculate_gas_need_with_storage(extra_solar_gwc, solar_cf, df, config,
+                                               balance=balance)
     gas_cost_annual = gas_need * config.financial.gas_cost_eur_per_mwh / 1000  # €B
 
     # Storage requirement
-    storage_need = calculate_storage_need(extra_solar_gwc, solar_cf, df, config)
+    storage_need = calculate_storage_need(extra_solar_gwc, solar_cf, df, config,
+                                          balance=balance)
 
     # CAPEX (from zero base - the model assumes these are new investments)
     solar_capex = total_solar * config.financial.solar_capex_eur_per_kw / 1000  # €B
@@ -78,7 +89,8 @@ def run_financial_analysis(
     df: pd.DataFrame,
     solar_cf: Dict[Tuple[str, str], Dict],
     extra_range: Optional[List[float]] = None,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> pd.DataFrame:
     """
     Run financial analysis across a range of solar capacities.
@@ -88,6 +100,8 @@ def run_financial_analysis(
         solar_cf: Capacity factor data
         extra_range: List of extra solar values to analyze
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
         DataFrame with cost analysis for each scenario
@@ -98,9 +112,11 @@ def run_financial_analysis(
     if extra_range is None:
         extra_range = list(range(-400, 501, 50))
 
+    if night is None:
+        night = extract_night_data(df)
     results = []
     for extra in extra_range:
-        costs = calculate_scenario_costs(extra, solar_cf, df, config)
+        costs = calculate_scenario_costs(extra, solar_cf, df, config, night=night)
         results.append(costs)
 
     return pd.DataFrame(results)
@@ -109,7 +125,8 @@ def run_financial_analysis(
 def find_optimal_capacity(
     df: pd.DataFrame,
     solar_cf: Dict[Tuple[str, str], Dict],
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> Dict[str, float]:
     """
     Find the solar capacity that minimizes total 30-year cost.
@@ -118,6 +135,8 @@ def find_optimal_capacity(
         df: Original DataFrame
         solar_cf: Capacity factor data
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
         Dict with optimal scenario parameters
@@ -129,9 +148,11 @@ def find_optimal_capacity(
     extra_range = np.arange(-400, 501, 10)
     min_cost = float('inf')
     optimal = None
+    if night is None:
+        night = extract_night_data(df)
 
     for extra in extra_range:
-        costs = calculate_scenario_costs(extra, solar_cf, df, config)
+        costs = calculate_scenario_costs(extra, solar_cf, df, config, night=night)
         if costs['total_30y_eur_b'] < min_cost:
             min_cost = costs['total_30y_eur_b']
             optimal = costs
@@ -143,7 +164,8 @@ def compare_scenarios(
     df: pd.DataFrame,
     solar_cf: Dict[Tuple[str, str], Dict],
     scenarios: Optional[Dict[str, float]] = None,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> pd.DataFrame:
     """
     Compare specific named scenarios.
@@ -153,6 +175,8 @@ def compare_scenarios(
         solar_cf: Capacity factor data
         scenarios: Dict mapping scenario names to extra solar GWc
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
         DataFrame comparing scenarios
@@ -170,16 +194,18 @@ def compare_scenarios(
             'Zéro gaz (~950 GWc)': 450,
         }
 
+    if night is None:
+        night = extract_night_data(df)
     results = []
     for name, extra in scenarios.items():
-        costs = calculate_scenario_costs(extra, solar_cf, df, config)
+        costs = calculate_scenario_costs(extra, solar_cf, df, config, night=night)
         costs['scenario'] = name
         results.append(costs)
 
     result_df = pd.DataFrame(results)
 
     # Add comparison to optimal
-    optimal = find_optimal_capacity(df, solar_cf, config)
+    optimal = find_optimal_capacity(df, solar_cf, config, night=night)
     optimal_cost = optimal['total_30y_eur_b']
     result_df['vs_optimal_eur_b'] = result_df['total_30y_eur_b'] - optimal_cost
 
@@ -49,6 +49,13 @@ COEFFICIENTS_PLAGE: Dict[str, float] = {
 }
 
 
+# Calendar month order
+_MOIS_ORDRE = (
+    'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
+    'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre',
+)
+
+
 @dataclass
 class HeatingConfig:
     """
@@ -273,15 +280,10 @@ def bilan_chauffage_annuel(
     if config is None:
         config = HeatingConfig()
 
-    mois_ordre = (
-        'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
-        'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre'
-    )
-
     bilan = {}
     total_twh = 0.0
 
-    for mois in mois_ordre:
+    for mois in _MOIS_ORDRE:
         t_ext = config.temperatures_exterieures.get(mois, 10.0)
         cop = interpoler_cop(t_ext, config.cop_par_temperature) if config.avec_pompe_a_chaleur else 1.0
         p_thermique_w = besoin_thermique_maison_w(config, t_ext)
@@ -387,11 +389,7 @@ def profil_chauffage_normalise(config: Optional[HeatingConfig] = None) -> list[f
     if config is None:
         config = HeatingConfig()
     bilan = bilan_chauffage_annuel(config)
-    mois_ordre = (
-        'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
-        'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre',
-    )
-    values = [bilan[m]['energie_mensuelle_twh'] for m in mois_ordre]
+    values = [bilan[m]['energie_mensuelle_twh'] for m in _MOIS_ORDRE]
     total = sum(values)
     if total == 0:
         return [1 / 12] * 12
@@ -12,7 +12,7 @@ Sheets generated:
     calc_chauffage   -- Heating sector kW demand (60 rows: 12 months x 5 slots)
 """
 
-from .writer import ODSWriter
+from .writer import BLANK_CELL, ODSWriter
 from .knob_registry import get_param_ref, PARAM_ROWS
 
 
@@ -112,7 +112,7 @@ def add_calc_industrie_sheet(writer: ODSWriter, db, industrie_config=None):
             'Formule: (HT*elec*eff + MT*elec/COP + BT*elec/COP '
             '+ force_motrice + electrochimie + autres) * (1-gain) * 1e9/8760'
         )},
-        {'value': ''},
+        BLANK_CELL,
     ])
 
 
@@ -198,7 +198,7 @@ def add_calc_tertiaire_sheet(writer: ODSWriter, db, tertiaire_config=None):
             'Formule: (chauffage*(1-renov)*(fossile/COP + 1-fossile) '
             '+ clim*(1-gain) + eclairage*(1-LED) + elec_spec + eau_chaude + autres) * 1e9/8760'
         )},
-        {'value': ''},
+        BLANK_CELL,
     ])
 
 
@@ -11,6 +11,12 @@ def create_styles(doc):
     """
     styles = {}
 
+    # Number format: 2 decimals. Numeric cells carry only office:value (no
+    # pre-rendered text), so display precision comes from this data style.
+    num2 = NumberStyle(name="num2")
+    num2.addElement(Number(decimalplaces=2, minintegerdigits=1))
+    doc.automaticstyles.addElement(num2)
+
     # Header style: bold, centered, blue background
     header = Style(name="header", family="table-cell")
     header.addElement(TextProperties(fontweight="bold", color="#FFFFFF"))
@@ -20,13 +26,13 @@ def create_styles(doc):
     styles['header'] = header
 
     # Number style: right-aligned, 2 decimals
-    number = Style(name="number", family="table-cell")
+    number = Style(name="number", family="table-cell", datastylename="num2")
     number.addElement(ParagraphProperties(textalign="end"))
     doc.automaticstyles.addElement(number)
     styles['number'] = number
 
     # Formula style: light blue background to indicate computed cells
-    formula = Style(name="formula", family="table-cell")
+    formula = Style(name="formula", family="table-cell", datastylename="num2")
     formula.addElement(TableCellProperties(backgroundcolor="#DAEEF3"))
     formula.addElement(ParagraphProperties(textalign="end"))
     doc.automaticstyles.addElement(formula)
@@ -39,7 +45,7 @@ def create_styles(doc):
     styles['text'] = text
 
     # Energy style: right-aligned for GW/TWh values
-    energy = Style(name="energy", family="table-cell")
+    energy = Style(name="energy", family="table-cell", datastylename="num2")
     energy.addElement(ParagraphProperties(textalign="end"))
     doc.automaticstyles.addElement(energy)
     styles['energy'] = energy
@@ -53,7 +59,7 @@ def create_styles(doc):
     styles['title'] = title
 
     # Total row style
-    total = Style(name="total", family="table-cell")
+    total = Style(name="total", family="table-cell", datastylename="num2")
     total.addElement(TextProperties(fontweight="bold"))
     total.addElement(TableCellProperties(backgroundcolor="#D9E2F3"))
     total.addElement(ParagraphProperties(textalign="end"))
@@ -2467,10 +2467,15 @@ def _build_param_rows() -> Dict[str, int]:
 
 PARAM_ROWS: Dict[str, int] = _build_param_rows()
 
+# Formula references for every knob, built once (the registry is static)
+PARAM_REFS: Dict[str, str] = {
+    name: f"[parametres.B{row}]" for name, row in PARAM_ROWS.items()
+}
+
 
 def get_param_ref(name: str) -> str:
     """Return ODF formula reference like ``[parametres.B42]``."""
-    return f"[parametres.B{PARAM_ROWS[name]}]"
+    return PARAM_REFS[name]
 
 
 def build_parametres_rows() -> list:
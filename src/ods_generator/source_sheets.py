@@ -20,6 +20,20 @@ MOIS_ORDRE = (
 )
 PLAGES = ('8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h')
 
+# Which REGISTRY entries are category headers (fixed at import)
+_IS_CATEGORY = tuple(isinstance(entry, CategoryEntry) for entry in REGISTRY)
+_CATEGORY_BLANK = {'value': '', 'style': 'category'}
+
+
+def _category_cells(row):
+    """Category header row — styled differently, label in first column."""
+    return [{'value': row[0], 'style': 'category'}] + [_CATEGORY_BLANK] * 4
+
+
+def _knob_cells(row):
+    """Knob row: name, value (editable knob), unit, source, description."""
+    return [{'value': v} for v in row]
+
 
 def add_parametres_sheet(writer: ODSWriter, db,
                          config=None, heating_config=None,
@@ -49,26 +63,10 @@ def add_parametres_sheet(writer: ODSWriter, db,
         title='Paramètres du modèle',
     )
 
-    for i, entry in enumerate(REGISTRY):
-        row = rows[i]
-        if isinstance(entry, CategoryEntry):
-            # Category header row — styled differently
-            cells = [
-                {'value': row[0], 'style': 'category'},
-                {'value': '', 'style': 'category'},
-                {'value': '', 'style': 'category'},
-                {'value': '', 'style': 'category'},
-                {'value': '', 'style': 'category'},
-            ]
-        else:
-            cells = [
-                {'value': row[0]},           # name
-                {'value': row[1]},            # value (editable knob)
-                {'value': row[2]},            # unit
-                {'value': row[3]},            # source
-                {'value': row[4]},            # description
-            ]
-        writer.add_formula_row(table, cells)
+    writer.add_formula_rows(table, [
+        _category_cells(row) if is_cat else _knob_cells(row)
+        for is_cat, row in zip(_IS_CATEGORY, rows)
+    ])
 
 
 def add_prod_nucleaire_hydraulique_sheet(writer: ODSWriter, db):
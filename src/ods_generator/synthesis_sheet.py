@@ -10,7 +10,7 @@ Consumption columns reference calc sheets (formula-based, traceable to parametre
 60 data rows (12 months x 5 time slots) plus monthly totals and annual total.
 """
 
-from .writer import ODSWriter
+from .writer import BLANK_CELL, ODSWriter
 from .knob_registry import get_param_ref
 
 
@@ -20,6 +20,9 @@ MOIS_ORDRE = (
 )
 PLAGES = ('8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h')
 DUREES = {'8h-13h': 5.0, '13h-18h': 5.0, '18h-20h': 2.0, '20h-23h': 3.0, '23h-8h': 9.0}
+# (mois, plage) of each data row in sheet order, and its column A label
+SLOTS = tuple((m, p) for m in MOIS_ORDRE for p in PLAGES)
+PERIOD_LABELS = tuple(f"{m} {p}" for m, p in SLOTS)
 
 HEADERS = [
     'Période',             # A
@@ -43,6 +46,46 @@ HEADERS = [
     'Total élec+H2 (kW)',  # S
 ]
 
+# Parametres knobs used by the synthesis formulas. Resolved once at import
+# so a knob renamed or dropped from the registry fails loudly (KeyError).
+SYNTHESIS_PARAMS = (
+    'kwc_par_maison',
+    'nombre_maisons',
+    'kwc_par_collectif',
+    'nombre_collectifs',
+    'solar_gwc_centrales',
+    'jours_par_mois',
+)
+PARAM_REFS = {name: get_param_ref(name) for name in SYNTHESIS_PARAMS}
+
+# Data-row formulas as str.format templates, built once. Placeholders:
+# {r} = synthesis / source sheet row, {slot_r} = calc_transport slot row,
+# {month_r} = calc_agriculture month row.
+F_PV_MAISONS = (f"of:={PARAM_REFS['kwc_par_maison']}"
+                f"*{PARAM_REFS['nombre_maisons']}"
+                "*[facteurs_solaires.C{r}]")
+F_PV_COLLECTIF = (f"of:={PARAM_REFS['kwc_par_collectif']}"
+                  f"*{PARAM_REFS['nombre_collectifs']}"
+                  "*[facteurs_solaires.C{r}]")
+F_PV_CENTRALES = (f"of:={PARAM_REFS['solar_gwc_centrales']}"
+                  "*1000000"
+                  "*[facteurs_solaires.C{r}]")
+F_HYDRAULIQUE = "of:=[prod_nucleaire_hydraulique.D{r}]*1000"
+F_NUCLEAIRE = "of:=[prod_nucleaire_hydraulique.C{r}]*1000"
+F_TOTAL_PROD = "of:=[.B{r}]+[.C{r}]+[.D{r}]+[.E{r}]+[.F{r}]+[.G{r}]"
+F_CHAUFFAGE = "of:=[calc_chauffage.H{r}]"
+F_TRANSPORT = "of:=[calc_transport.B{slot_r}]"
+F_AGRICULTURE = "of:=[calc_agriculture.B{month_r}]"
+F_TOTAL_CONSO = "of:=[.I{r}]+[.J{r}]+[.K{r}]+[.L{r}]+[.M{r}]"
+F_DEFICIT = "of:=MAX(0;[.N{r}]+[.R{r}]-[.H{r}])"
+F_ENERGIE_GAZ = ("of:=[.O{r}]*[.P{r}]"
+                 f"*{PARAM_REFS['jours_par_mois']}"
+                 "/1000000000")
+F_TOTAL_ELEC_H2 = "of:=[.N{r}]+[.R{r}]"
+
+# Empty columns B through P of the total rows, written as one repeated cell
+_TOTAL_PADDING = {'value': None, 'repeat': 15}
+
 
 def add_synthesis_sheet(writer: ODSWriter, db):
     """Generate the synthesis sheet with cross-sheet formulas.
@@ -51,8 +94,8 @@ def add_synthesis_sheet(writer: ODSWriter, db):
     - An ODF formula (of:=...) referencing source sheets
     - A pre-computed office:value so it displays immediately
     """
-    synthesis_data = db.load_synthesis()
-    if not synthesis_data:
+    cols = db.load_synthesis_columns(SLOTS)
+    if not cols:
         raise ValueError("No synthesis data in DB. Run pipeline first.")
 
     table = writer.add_formula_sheet(
@@ -61,199 +104,103 @@ def add_synthesis_sheet(writer: ODSWriter, db):
         title='Moulinette simplifiée avec PAC — formules traçables',
     )
 
-    # Build lookup for pre-computed values
-    lookup = {}
-    for row in synthesis_data:
-        lookup[(row['mois'], row['plage'])] = row
-
-    # Parameter references from knob registry
-    ref_kwc_maison = get_param_ref('kwc_par_maison')
-    ref_n_maisons = get_param_ref('nombre_maisons')
-    ref_kwc_collectif = get_param_ref('kwc_par_collectif')
-    ref_n_collectifs = get_param_ref('nombre_collectifs')
-    ref_gwc_centrales = get_param_ref('solar_gwc_centrales')
-    ref_jours = get_param_ref('jours_par_mois')
+    # Gas energy per slot in data-row order, reused by the totals below
+    gas_by_slot = cols['energie_gaz_twh']
 
     # Data rows: title=row1, header=row2, data starts row3
     row_num = 3
-    slot_index = 0  # 0-based index into 60 rows (for calc_chauffage reference)
-    for mois_idx, mois in enumerate(MOIS_ORDRE):
-        for plage_idx, plage in enumerate(PLAGES):
-            key = (mois, plage)
-            vals = lookup.get(key, {})
-            duree = DUREES[plage]
-
-            # Source sheet row: same ordering as synthesis
-            r = row_num
-
-            # Calc sheet row references:
-            # calc_chauffage: 60 data rows, row 3-62, column H = besoin_electrique_kw
-            chauffage_r = r  # Same row ordering
-            # calc_transport: 5 slot rows (row 3-7), column B = transport_kw
-            transport_slot_r = 3 + plage_idx  # Row per slot type
-            # calc_industrie: single value at row 3, column B = flat_kw
-            # calc_tertiaire: single value at row 3, column B = flat_kw
-            # calc_agriculture: 12 monthly rows (row 3-14), column B = kw
-            agriculture_month_r = 3 + mois_idx
-
-            cells = [
-                # A: Period label (static)
-                {'value': f"{mois} {plage}"},
-
-                # B: PV maisons (kW) = kwc_par_maison * nombre_maisons * capacity_factor
-                {
-                    'value': vals.get('pv_maisons_kw', 0.0),
-                    'formula': (
-                        f"of:={ref_kwc_maison}"
-                        f"*{ref_n_maisons}"
-                        f"*[facteurs_solaires.C{r}]"
-                    ),
-                },
-
-                # C: PV collectif (kW) = kwc_par_collectif * nombre_collectifs * capacity_factor
-                {
-                    'value': vals.get('pv_collectif_kw', 0.0),
-                    'formula': (
-                        f"of:={ref_kwc_collectif}"
-                        f"*{ref_n_collectifs}"
-                        f"*[facteurs_solaires.C{r}]"
-                    ),
-                },
-
-                # D: PV centrales (kW) = GWc * 1e6 * capacity_factor
-                {
-                    'value': vals.get('pv_centrales_kw', 0.0),
-                    'formula': (
-                        f"of:={ref_gwc_centrales}"
-                        f"*1000000"
-                        f"*[facteurs_solaires.C{r}]"
-                    ),
-                },
-
-                # E: Hydraulique (kW) = MW * 1000
-                {
-                    'value': vals.get('hydraulique_kw', 0.0),
-                    'formula': f"of:=[prod_nucleaire_hydraulique.D{r}]*1000",
-                },
-
-                # F: Éolien (kW) = 0
-                {
-                    'value': 0.0,
-                    'formula': "of:=0",
-                },
-
-                # G: Nucléaire (kW) = MW * 1000
-                {
-                    'value': vals.get('nucleaire_kw', 0.0),
-                    'formula': f"of:=[prod_nucleaire_hydraulique.C{r}]*1000",
-                },
-
-                # H: Total production = B+C+D+E+F+G
-                {
-                    'value': vals.get('total_production_kw', 0.0),
-                    'formula': f"of:=[.B{r}]+[.C{r}]+[.D{r}]+[.E{r}]+[.F{r}]+[.G{r}]",
-                },
-
-                # I: Chauffage (kW) — from calc_chauffage sheet
-                {
-                    'value': vals.get('chauffage_kw', 0.0),
-                    'formula': f"of:=[calc_chauffage.H{chauffage_r}]",
-                },
-
-                # J: Transport (kW) — from calc_transport sheet
-                {
-                    'value': vals.get('transport_kw', 0.0),
-                    'formula': f"of:=[calc_transport.B{transport_slot_r}]",
-                },
-
-                # K: Industrie (kW) — flat value from calc_industrie
-                {
-                    'value': vals.get('industrie_kw', 0.0),
-                    'formula': f"of:=[calc_industrie.B3]",
-                },
-
-                # L: Tertiaire (kW) — flat value from calc_tertiaire
-                {
-                    'value': vals.get('tertiaire_kw', 0.0),
-                    'formula': f"of:=[calc_tertiaire.B3]",
-                },
-
-                # M: Agriculture (kW) — monthly value from calc_agriculture
-                {
-                    'value': vals.get('agriculture_kw', 0.0),
-                    'formula': f"of:=[calc_agriculture.B{agriculture_month_r}]",
-                },
-
-                # N: Total conso = I+J+K+L+M
-                {
-                    'value': vals.get('total_conso_kw', 0.0),
-                    'formula': f"of:=[.I{r}]+[.J{r}]+[.K{r}]+[.L{r}]+[.M{r}]",
-                },
-
-                # O: Déficit gaz = MAX(0, total_elec_h2 - prod)
-                {
-                    'value': vals.get('deficit_gaz_kw', 0.0),
-                    'formula': f"of:=MAX(0;[.N{r}]+[.R{r}]-[.H{r}])",
-                },
-
-                # P: Durée (h) - static
-                {'value': duree},
-
-                # Q: Énergie gaz (TWh) = deficit * durée * jours_par_mois / 1e9
-                {
-                    'value': vals.get('energie_gaz_twh', 0.0),
-                    'formula': (
-                        f"of:=[.O{r}]*[.P{r}]"
-                        f"*{ref_jours}"
-                        f"/1000000000"
-                    ),
-                },
-
-                # R: H2 électrolyse (kW) — flat value from balance
-                {
-                    'value': vals.get('h2_electrolyse_kw', 0.0),
-                },
-
-                # S: Total élec+H2 = N + R
-                {
-                    'value': (vals.get('total_conso_kw', 0.0)
-                              + vals.get('h2_electrolyse_kw', 0.0)),
-                    'formula': f"of:=[.N{r}]+[.R{r}]",
-                },
-            ]
-
-            writer.add_formula_row(table, cells)
-            row_num += 1
-            slot_index += 1
+    # slot_index: 0-based index into 60 rows (for calc_chauffage reference)
+    for slot_index, (
+        pv_maisons, pv_collectif, pv_centrales, hydraulique, nucleaire,
+        total_prod, chauffage, transport, industrie, tertiaire, agriculture,
+        total_conso, deficit, energie_gaz, h2,
+    ) in enumerate(zip(
+        cols['pv_maisons_kw'], cols['pv_collectif_kw'], cols['pv_centrales_kw'],
+        cols['hydraulique_kw'], cols['nucleaire_kw'], cols['total_production_kw'],
+        cols['chauffage_kw'], cols['transport_kw'], cols['industrie_kw'],
+        cols['tertiaire_kw'], cols['agriculture_kw'], cols['total_conso_kw'],
+        cols['deficit_gaz_kw'], cols['energie_gaz_twh'], cols['h2_electrolyse_kw'],
+    )):
+        mois_idx, plage_idx = divmod(slot_index, len(PLAGES))
+        duree = DUREES[PLAGES[plage_idx]]
+
+        # Source sheet row: same ordering as synthesis
+        r = row_num
+
+        # Calc sheet row references:
+        # calc_chauffage: 60 data rows, row 3-62, column H = besoin_electrique_kw
+        chauffage_r = r  # Same row ordering
+        # calc_transport: 5 slot rows (row 3-7), column B = transport_kw
+        transport_slot_r = 3 + plage_idx  # Row per slot type
+        # calc_industrie: single value at row 3, column B = flat_kw
+        # calc_tertiaire: single value at row 3, column B = flat_kw
+        # calc_agriculture: 12 monthly rows (row 3-14), column B = kw
+        agriculture_month_r = 3 + mois_idx
+
+        row = []
+        # A: Period label (static)
+        writer.emit_text(row, PERIOD_LABELS[slot_index])
+        # B: PV maisons (kW) = kwc_par_maison * nombre_maisons * capacity_factor
+        writer.emit_formula_float(row, pv_maisons, F_PV_MAISONS.format(r=r))
+        # C: PV collectif (kW) = kwc_par_collectif * nombre_collectifs * capacity_factor
+        writer.emit_formula_float(row, pv_collectif, F_PV_COLLECTIF.format(r=r))
+        # D: PV centrales (kW) = GWc * 1e6 * capacity_factor
+        writer.emit_formula_float(row, pv_centrales, F_PV_CENTRALES.format(r=r))
+        # E: Hydraulique (kW) = MW * 1000
+        writer.emit_formula_float(row, hydraulique, F_HYDRAULIQUE.format(r=r))
+        # F: Éolien (kW) = 0
+        writer.emit_formula_float(row, 0.0, "of:=0")
+        # G: Nucléaire (kW) = MW * 1000
+        writer.emit_formula_float(row, nucleaire, F_NUCLEAIRE.format(r=r))
+        # H: Total production = B+C+D+E+F+G
+        writer.emit_formula_float(row, total_prod, F_TOTAL_PROD.format(r=r))
+        # I: Chauffage (kW) — from calc_chauffage sheet
+        writer.emit_formula_float(row, chauffage, F_CHAUFFAGE.format(r=chauffage_r))
+        # J: Transport (kW) — from calc_transport sheet
+        writer.emit_formula_float(row, transport, F_TRANSPORT.format(slot_r=transport_slot_r))
+        # K: Industrie (kW) — flat value from calc_industrie
+        writer.emit_formula_float(row, industrie, "of:=[calc_industrie.B3]")
+        # L: Tertiaire (kW) — flat value from calc_tertiaire
+        writer.emit_formula_float(row, tertiaire, "of:=[calc_tertiaire.B3]")
+        # M: Agriculture (kW) — monthly value from calc_agriculture
+        writer.emit_formula_float(
+            row, agriculture, F_AGRICULTURE.format(month_r=agriculture_month_r))
+        # N: Total conso = I+J+K+L+M
+        writer.emit_formula_float(row, total_conso, F_TOTAL_CONSO.format(r=r))
+        # O: Déficit gaz = MAX(0, total_elec_h2 - prod)
+        writer.emit_formula_float(row, deficit, F_DEFICIT.format(r=r))
+        # P: Durée (h) - static
+        writer.emit_float(row, duree)
+        # Q: Énergie gaz (TWh) = deficit * durée * jours_par_mois / 1e9
+        writer.emit_formula_float(row, energie_gaz, F_ENERGIE_GAZ.format(r=r))
+        # R: H2 électrolyse (kW) — flat value from balance
+        writer.emit_float(row, h2)
+        # S: Total élec+H2 = N + R
+        writer.emit_formula_float(row, total_conso + h2, F_TOTAL_ELEC_H2.format(r=r))
+
+        writer.add_row(table, row)
+        row_num += 1
 
     # Monthly totals
     row_num_after_data = row_num
     # Add blank separator
-    writer.add_formula_row(table, [{'value': ''} for _ in HEADERS])
+    writer.add_formula_row(table, [BLANK_CELL] * len(HEADERS))
     row_num += 1
 
     # Monthly summary rows
     writer.add_formula_row(table, [
         {'value': 'TOTAUX MENSUELS', 'style': 'total'},
-    ] + [{'value': ''} for _ in range(len(HEADERS) - 1)])
+    ] + [BLANK_CELL] * (len(HEADERS) - 1))
     row_num += 1
 
     for i, mois in enumerate(MOIS_ORDRE):
         first_row = 3 + i * 5  # First slot row for this month
         last_row = first_row + 4  # Last slot row for this month
 
-        # Compute pre-computed monthly gas total
-        monthly_gas = sum(
-            lookup.get((mois, p), {}).get('energie_gaz_twh', 0.0)
-            for p in PLAGES
-        )
+        # Pre-computed monthly gas total over this month's slots
+        monthly_gas = sum(gas_by_slot[i * 5:(i + 1) * 5])
 
-        cells = [
-            {'value': mois, 'style': 'total'},
-        ]
-        # For columns B through P, leave empty
-        for _ in range(15):
-            cells.append({'value': ''})
+        cells = [{'value': mois, 'style': 'total'}, _TOTAL_PADDING]
 
         # Q: Monthly gas total = SUM of 5 rows
         cells.append({
@@ -263,8 +210,7 @@ def add_synthesis_sheet(writer: ODSWriter, db):
         })
 
         # R, S: empty for monthly totals
-        cells.append({'value': ''})
-        cells.append({'value': ''})
+        cells.extend((BLANK_CELL, BLANK_CELL))
 
         writer.add_formula_row(table, cells)
         row_num += 1
@@ -273,15 +219,9 @@ def add_synthesis_sheet(writer: ODSWriter, db):
     monthly_start = row_num_after_data + 2  # After blank + header
     monthly_end = monthly_start + 11
 
-    total_gas = sum(
-        v.get('energie_gaz_twh', 0.0) for v in lookup.values()
-    )
+    total_gas = sum(gas_by_slot)
 
-    cells = [
-        {'value': 'TOTAL ANNUEL', 'style': 'total'},
-    ]
-    for _ in range(15):
-        cells.append({'value': ''})
+    cells = [{'value': 'TOTAL ANNUEL', 'style': 'total'}, _TOTAL_PADDING]
     cells.append({
         'value': total_gas,
         'formula': f"of:=SUM([.Q{monthly_start}:.Q{monthly_end}])",
@@ -289,7 +229,6 @@ def add_synthesis_sheet(writer: ODSWriter, db):
     })
 
     # R, S: empty for annual total
-    cells.append({'value': ''})
-    cells.append({'value': ''})
+    cells.extend((BLANK_CELL, BLANK_CELL))
 
     writer.add_formula_row(table, cells)
@@ -1,28 +1,150 @@
 """ODS writer with cross-sheet formula support.
 
-Uses odfpy to create OpenDocument Spreadsheet files where every numeric
-cell in the synthesis sheet is a formula referencing source data sheets.
-Pre-computed values are set alongside formulas so numbers display immediately.
+Creates OpenDocument Spreadsheet files where every numeric cell in the
+synthesis sheet is a formula referencing source data sheets. Pre-computed
+values are set alongside formulas so numbers display immediately.
+
+Sheets are not built as an odfpy DOM: each row is rendered to XML from
+string templates as it is added, and save() streams the rows straight
+into content.xml inside the ZIP container. odfpy is only used for the
+styles, meta and manifest parts.
 """
 
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from odf import manifest
+from odf.namespaces import FONS, NUMBERNS, OFFICENS, OFNS, STYLENS, TABLENS, TEXTNS
 from odf.opendocument import OpenDocumentSpreadsheet
-from odf.table import Table, TableRow, TableCell
-from odf.text import P
 
 from .formatting import create_styles
 
 
+# Pre-escaped XML templates
+_TITLE_CELL = (
+    '<table:table-row><table:table-cell table:style-name="title" '
+    'table:number-columns-spanned="%d"><text:p>%s</text:p>'
+    '</table:table-cell></table:table-row>'
+)
+_HEADER_CELL = (
+    '<table:table-cell table:style-name="header"><text:p>%s</text:p>'
+    '</table:table-cell>'
+)
+_CELL_SUFFIX = '</text:p></table:table-cell>'
+_REPEAT_ATTR = ' table:number-columns-repeated="%d"'
+
+# Shared empty cell for separator and padding columns in formula rows.
+# add_formula_row recognizes it by identity and writes a bare cell.
+BLANK_CELL = {'value': ''}
+_BLANK_CELL_XML = '<table:table-cell/>'
+
+
+def _title_header_xml(headers: list, title: str = None) -> str:
+    """Serialize the optional title row and the header row of a sheet."""
+    parts = []
+    if title:
+        parts.append(_TITLE_CELL % (len(headers), escape(title)))
+    parts.append('<table:table-row>')
+    parts.extend(_HEADER_CELL % escape(str(h)) for h in headers)
+    parts.append('</table:table-row>')
+    return ''.join(parts)
+
+
+# Opening cell tags interned per (style, value type). A float prefix ends
+# inside the office:value attribute; a string prefix before the closing '>'.
+# A style of None emits no style attribute.
+_CELL_PREFIXES = {}
+
+
+def _cell_prefix(style: Optional[str], value_type: str) -> str:
+    """Return the cached opening markup of a cell up to its value."""
+    key = (style, value_type)
+    prefix = _CELL_PREFIXES.get(key)
+    if prefix is None:
+        prefix = '<table:table-cell'
+        if style is not None:
+            prefix += f' table:style-name={quoteattr(style)}'
+        prefix += f' office:value-type="{value_type}"'
+        if value_type == 'float':
+            prefix += ' office:value="'
+        _CELL_PREFIXES[key] = prefix
+    return prefix
+
+
+_XML_PROLOGUE = "<?xml version='1.0' encoding='UTF-8'?>\n"
+_CONTENT_OPEN = (
+    '<office:document-content'
+    f' xmlns:office="{OFFICENS}" xmlns:style="{STYLENS}"'
+    f' xmlns:text="{TEXTNS}" xmlns:table="{TABLENS}"'
+    f' xmlns:number="{NUMBERNS}" xmlns:fo="{FONS}" xmlns:of="{OFNS}"'
+    ' office:version="1.2">'
+)
+_CONTENT_CLOSE = '</office:spreadsheet></office:body></office:document-content>'
+
+# save() compression modes; ODF allows both for the XML parts
+ZIP_COMPRESSION = {'deflate': zipfile.ZIP_DEFLATED, 'store': zipfile.ZIP_STORED}
+# Write buffer between the XML text stream and the zip entry
+_CONTENT_BUFFER_SIZE = 1 << 20
+# Bump whenever _write_table_xml_fast output changes, to invalidate cached sheets
+SHEET_CACHE_VERSION = 3
+
+
+class Sheet:
+    """A worksheet held as serialized <table:table-row> fragments."""
+
+    __slots__ = ('name', 'rows')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = []
+
+    def write(self, out):
+        """Write the <table:table> element to a text stream."""
+        out.write('<table:table table:name=%s>' % quoteattr(self.name))
+        out.writelines(self.rows)
+        out.write('</table:table>')
+
+
 class ODSWriter:
     """ODS spreadsheet writer with formula and cross-sheet reference support."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Optional directory for serialized data sheets. When set,
+                each data sheet's XML is cached under a hash of its content and
+                reused by later runs with identical source data.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.doc = OpenDocumentSpreadsheet()
         self.styles = create_styles(self.doc)
         self.sheets = {}
+        # Default cell styles, resolved once (None when create_styles lacks one)
+        self._s_formula = self._style_or_none('formula')
+        self._s_number = self._style_or_none('number')
+        self._s_text = self._style_or_none('text')
+
+    def _style_or_none(self, style_name: str) -> Optional[str]:
+        return style_name if style_name in self.styles else None
 
-    def add_data_sheet(self, name: str, headers: list, rows: list, title: str = None) -> Table:
+    def _new_sheet(self, name: str) -> Sheet:
+        sheet = Sheet(name)
+        self.sheets[name] = sheet
+        return sheet
+
+    def add_data_sheet(self, name: str, headers: list, rows: list, title: str = None) -> Sheet:
         """Add a data sheet with static values.
 
+        The whole sheet is serialized at once by _write_table_xml_fast, or
+        read back from cache_dir when the same content was serialized before.
+
         Args:
             name: Sheet name
             headers: List of column header strings
@@ -30,43 +152,70 @@ class ODSWriter:
             title: Optional title row above headers
 
         Returns:
-            The created Table object
+            The created Sheet
         """
-        table = Table(name=name)
-
-        # Optional title row
-        if title:
-            tr = TableRow()
-            tc = TableCell(stylename=self.styles.get('title', None))
-            tc.setAttrNS(
-                'urn:oasis:names:tc:opendocument:xmlns:table:1.0',
-                'number-columns-spanned', str(len(headers))
-            )
-            tc.addElement(P(text=title))
-            tr.addElement(tc)
-            table.addElement(tr)
-
-        # Header row
-        tr = TableRow()
-        for h in headers:
-            tc = TableCell(stylename=self.styles.get('header', None))
-            tc.addElement(P(text=str(h)))
-            tr.addElement(tc)
-        table.addElement(tr)
-
-        # Data rows
+        if self.cache_dir is None:
+            xml = self._write_table_xml_fast(name, headers, rows, title)
+        else:
+            xml = self._cached_table_xml(name, headers, rows, title)
+        sheet = self._new_sheet(name)
+        sheet.rows.append(xml)
+        return sheet
+
+    def _cached_table_xml(self, name: str, headers: list, rows: list,
+                          title: str = None) -> str:
+        """Serialize a data sheet, reusing the on-disk copy for identical content."""
+        payload = pickle.dumps((SHEET_CACHE_VERSION, self._s_number, self._s_text,
+                                name, list(headers), [tuple(r) for r in rows], title))
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        safe_name = name.replace('/', '_').replace(' ', '_')
+        cache_file = self.cache_dir / f"ods_{safe_name}_{digest}.xml"
+
+        if cache_file.exists():
+            return cache_file.read_text(encoding='utf-8')
+
+        xml = self._write_table_xml_fast(name, headers, rows, title)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so an interrupted run never
+        # leaves a truncated sheet behind as a cache hit
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(xml)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return xml
+
+    def _write_table_xml_fast(self, name: str, headers: list, rows: list,
+                              title: str = None, render_text: bool = False) -> str:
+        """Serialize the rows of a static data sheet to one XML string.
+
+        Produces the same markup as add_formula_sheet + _write_cell with
+        default styles, using str.join over pre-escaped templates.
+        """
+        parts = [_title_header_xml(headers, title)]
+        float_prefix = _cell_prefix(self._s_number, 'float')
+        string_prefix = _cell_prefix(self._s_text, 'string')
+        append = parts.append
         for row in rows:
-            tr = TableRow()
+            append('<table:table-row>')
             for val in row:
-                tc = self._make_value_cell(val)
-                tr.addElement(tc)
-            table.addElement(tr)
-
-        self.doc.spreadsheet.addElement(table)
-        self.sheets[name] = table
-        return table
-
-    def add_formula_sheet(self, name: str, headers: list, title: str = None) -> Table:
+                if isinstance(val, (int, float)):
+                    if render_text:
+                        text = f"{val:.2f}" if isinstance(val, float) else str(val)
+                        append(f'{float_prefix}{val}"><text:p>{text}{_CELL_SUFFIX}')
+                    else:
+                        append(f'{float_prefix}{val}"/>')
+                else:
+                    text = escape(str(val)) if val is not None else ''
+                    append(f'{string_prefix}><text:p>{text}{_CELL_SUFFIX}')
+            append('</table:table-row>')
+
+        return ''.join(parts)
+
+    def add_formula_sheet(self, name: str, headers: list, title: str = None) -> Sheet:
         """Create an empty sheet ready for formula rows.
 
         Args:
@@ -75,113 +224,171 @@ class ODSWriter:
             title: Optional title
 
         Returns:
-            The created Table object (add rows with add_formula_row)
+            The created Sheet (add rows with add_formula_row)
         """
-        table = Table(name=name)
-
-        if title:
-            tr = TableRow()
-            tc = TableCell(stylename=self.styles.get('title', None))
-            tc.setAttrNS(
-                'urn:oasis:names:tc:opendocument:xmlns:table:1.0',
-                'number-columns-spanned', str(len(headers))
-            )
-            tc.addElement(P(text=title))
-            tr.addElement(tc)
-            table.addElement(tr)
-
-        tr = TableRow()
-        for h in headers:
-            tc = TableCell(stylename=self.styles.get('header', None))
-            tc.addElement(P(text=str(h)))
-            tr.addElement(tc)
-        table.addElement(tr)
-
-        self.doc.spreadsheet.addElement(table)
-        self.sheets[name] = table
-        return table
-
-    def add_formula_row(self, table: Table, cells: list):
+        sheet = self._new_sheet(name)
+        sheet.rows.append(_title_header_xml(headers, title))
+        return sheet
+
+    def add_formula_row(self, table: Sheet, cells: list):
         """Add a row with formula and/or value cells.
 
+        The row is serialized to XML as soon as it is added.
+
         Args:
-            table: Target Table object
+            table: Target Sheet
             cells: List of dicts, each with:
                 - 'value': The pre-computed value (number or string)
                 - 'formula': Optional ODF formula string (e.g., "of:=[sheet.C5]*1000")
                 - 'style': Optional style name override
+                - 'repeat': Optional count of identical consecutive cells,
+                  written once with table:number-columns-repeated
+                BLANK_CELL may be used for empty padding cells.
         """
-        tr = TableRow()
+        parts = ['<table:table-row>']
         for cell in cells:
+            if cell is BLANK_CELL:
+                parts.append(_BLANK_CELL_XML)
+                continue
             value = cell.get('value')
             formula = cell.get('formula')
             style_name = cell.get('style')
+            repeat = cell.get('repeat', 1)
 
-            if formula:
-                style = self.styles.get(style_name or 'formula', None)
+            if style_name:
+                style_name = self._style_or_none(style_name)
+            elif formula:
+                style_name = self._s_formula
             elif isinstance(value, (int, float)):
-                style = self.styles.get(style_name or 'number', None)
+                style_name = self._s_number
             else:
-                style = self.styles.get(style_name or 'text', None)
+                style_name = self._s_text
+
+            parts.append(self._write_cell(value, formula, style_name, repeat=repeat))
+        parts.append('</table:table-row>')
+        table.rows.append(''.join(parts))
 
-            tc = self._write_cell(value, formula, style)
-            tr.addElement(tc)
-        table.addElement(tr)
+    def add_formula_rows(self, table: Sheet, rows: list):
+        """Add several rows at once (see add_formula_row for the cell format)."""
+        for cells in rows:
+            self.add_formula_row(table, cells)
 
-    def _write_cell(self, value, formula=None, style=None):
-        """Create a TableCell with optional formula and pre-computed value.
+    # Specialized cell emitters, for callers that know each column's cell
+    # kind statically. Each appends one serialized cell to `row`, a list
+    # later passed to add_row; styles default as in add_formula_row.
+
+    def emit_formula_float(self, row: list, value, formula: str, style: str = None):
+        """Append a numeric cell carrying a formula and its pre-computed value."""
+        row.append(f'{_cell_prefix(style or self._s_formula, "float")}{value}"'
+                   f' table:formula={quoteattr(formula)}/>')
+
+    def emit_float(self, row: list, value, style: str = None):
+        """Append a static numeric cell."""
+        row.append(f'{_cell_prefix(style or self._s_number, "float")}{value}"/>')
+
+    def emit_text(self, row: list, text: str, style: str = None):
+        """Append a static text cell."""
+        row.append(f'{_cell_prefix(style or self._s_text, "string")}>'
+                   f'<text:p>{escape(text)}{_CELL_SUFFIX}')
+
+    def add_row(self, table: Sheet, row: list):
+        """Add a row of cells built with the emit_* methods."""
+        table.rows.append(f'<table:table-row>{"".join(row)}</table:table-row>')
+
+    def _write_cell(self, value, formula=None, style=None,
+                    render_text: bool = False, repeat: int = 1) -> str:
+        """Serialize a table cell with optional formula and pre-computed value.
 
         For formula cells, both the formula attribute and the pre-computed
         value are set, so numbers display without needing recalculation.
+        Numeric cells carry only office:value; spreadsheet apps render it
+        through the style's number format (see formatting.create_styles).
 
         ODF formula syntax:
         - Cross-sheet: of:=[sheet_name.C5]
         - In-sheet: of:=[.B5]+[.C5]
         - Functions: of:=MAX(0,[.N5]-[.H5])
-        """
-        attrs = {}
-        if style:
-            attrs['stylename'] = style
 
-        if formula:
-            attrs['formula'] = formula
-
-        if isinstance(value, (int, float)):
-            attrs['valuetype'] = 'float'
-            attrs['value'] = str(value)
-            tc = TableCell(**attrs)
-            tc.addElement(P(text=f"{value:.2f}" if isinstance(value, float) else str(value)))
-        elif value is not None:
-            attrs['valuetype'] = 'string'
-            tc = TableCell(**attrs)
-            tc.addElement(P(text=str(value)))
-        else:
-            tc = TableCell(**attrs)
-
-        return tc
+        Args:
+            value: Number, string or None (empty cell)
+            formula: Optional ODF formula string
+            style: Style name, or None for no style attribute
+            render_text: Also emit the value as display text (<text:p>) for
+                consumers that do not read office:value
+            repeat: Number of consecutive columns the cell stands for
+        """
+        formula_attr = f' table:formula={quoteattr(formula)}' if formula else ''
+        if repeat > 1:
+            formula_attr += _REPEAT_ATTR % repeat
 
-    def _make_value_cell(self, value, style_name=None):
-        """Create a simple value cell (no formula)."""
         if isinstance(value, (int, float)):
-            style = self.styles.get(style_name or 'number', None)
-            tc = TableCell(
-                valuetype='float',
-                value=str(value),
-                stylename=style,
-            )
-            tc.addElement(P(text=f"{value:.2f}" if isinstance(value, float) else str(value)))
-        else:
-            style = self.styles.get(style_name or 'text', None)
-            tc = TableCell(valuetype='string', stylename=style)
-            tc.addElement(P(text=str(value) if value is not None else ""))
-        return tc
-
-    def save(self, path: str):
+            if not render_text:
+                return f'{_cell_prefix(style, "float")}{value}"{formula_attr}/>'
+            text = f"{value:.2f}" if isinstance(value, float) else str(value)
+            return (f'{_cell_prefix(style, "float")}{value}"{formula_attr}>'
+                    f'<text:p>{text}{_CELL_SUFFIX}')
+        if value is not None:
+            return (f'{_cell_prefix(style, "string")}{formula_attr}>'
+                    f'<text:p>{escape(str(value))}{_CELL_SUFFIX}')
+
+        style_attr = f' table:style-name={quoteattr(style)}' if style else ''
+        return f'<table:table-cell{style_attr}{formula_attr}/>'
+
+    def save(self, path: str, compresslevel: Optional[int] = None,
+             compression: str = 'deflate'):
         """Save the ODS document.
 
+        The ZIP container is written here rather than by odfpy's save():
+        content.xml is streamed sheet by sheet into its zip entry through
+        a buffered text writer, and deflate can run at a chosen level
+        (odfpy always uses zlib's default level).
+
         Args:
             path: Output file path (e.g., "output/modele_transition.ods")
+            compresslevel: Deflate level for the XML parts (1-9; default:
+                zlib's default level). Level 1 is 2-3x faster but about 30%
+                larger, for intermediate outputs rather than deliverables
+            compression: 'deflate', or 'store' to write the XML parts
+                uncompressed (still a valid ODS, several times larger)
         """
-        from pathlib import Path as P
-        P(path).parent.mkdir(parents=True, exist_ok=True)
-        self.doc.save(path)
+        if compression not in ZIP_COMPRESSION:
+            raise ValueError(f"Unknown compression {compression!r}, "
+                             f"expected one of {sorted(ZIP_COMPRESSION)}")
+        names = ['styles.xml', 'content.xml', 'meta.xml']
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(path, 'w', ZIP_COMPRESSION[compression],
+                             compresslevel=compresslevel) as zf:
+            # The mimetype entry must come first and stay uncompressed
+            zf.writestr('mimetype', self.doc.mimetype, compress_type=zipfile.ZIP_STORED)
+            zf.writestr('styles.xml', self.doc.stylesxml().encode('utf-8'))
+            with io.TextIOWrapper(
+                io.BufferedWriter(zf.open('content.xml', 'w'), _CONTENT_BUFFER_SIZE),
+                encoding='utf-8',
+            ) as out:
+                self._write_content(out)
+            zf.writestr('meta.xml', self.doc.metaxml().encode('utf-8'))
+            zf.writestr('META-INF/manifest.xml', self._manifest_xml(names))
+
+    def _write_content(self, out):
+        """Write content.xml: automatic styles, then every sheet in order."""
+        out.write(_XML_PROLOGUE)
+        out.write(_CONTENT_OPEN)
+        out.write('<office:automatic-styles>')
+        for style in self.doc.automaticstyles.childNodes:
+            style.toXml(2, out)
+        out.write('</office:automatic-styles>')
+        out.write('<office:body><office:spreadsheet>')
+        for sheet in self.sheets.values():
+            sheet.write(out)
+        out.write(_CONTENT_CLOSE)
+
+    def _manifest_xml(self, names) -> bytes:
+        """Build META-INF/manifest.xml listing the document parts."""
+        m = manifest.Manifest()
+        m.addElement(manifest.FileEntry(fullpath='/', mediatype=self.doc.mimetype))
+        for name in names:
+            m.addElement(manifest.FileEntry(fullpath=name, mediatype='text/xml'))
+        out = io.StringIO()
+        out.write(_XML_PROLOGUE)
+        m.toXml(0, out)
+        return out.getvalue().encode('utf-8')
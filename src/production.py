@@ -4,11 +4,13 @@ Production module for the Energy Transition Model.
 Handles solar, nuclear, and hydro production calculations.
 """
 
+from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from .config import EnergyModelConfig, DEFAULT_CONFIG
-from .temporal import fraction_solaire_attendue
+from .temporal import fraction_solaire_df
 
 
 def extract_base_production(
@@ -28,14 +30,54 @@ def extract_base_production(
     Returns:
         Dict mapping month names to base production in kW
     """
-    base_prod_by_month = {}
+    # First nighttime row of each month, in a single filter pass
+    night = df.loc[df['Plage'] == '23h-8h', ['Mois', 'Production_kW']]
+    night = night.drop_duplicates('Mois')
+    return dict(zip(night['Mois'].to_numpy(), night['Production_kW'].to_numpy()))
 
-    for mois in df['Mois'].unique():
-        night_data = df[(df['Mois'] == mois) & (df['Plage'] == '23h-8h')]
-        if len(night_data) > 0:
-            base_prod_by_month[mois] = night_data['Production_kW'].values[0]
 
-    return base_prod_by_month
+@dataclass(frozen=True, slots=True)
+class NightSlot:
+    """Nighttime (23h-8h) slot of one month, as floats."""
+
+    production_kw: float
+    consommation_kw: float
+    deficit_kw: float
+    duree_h: float
+
+
+def extract_night_data(df: pd.DataFrame) -> Dict[str, NightSlot]:
+    """
+    Extract the nighttime (23h-8h) slot of each month.
+
+    Solar capacity does not change the night slot, so callers sweeping
+    capacity can extract it once instead of filtering df at every point.
+
+    Args:
+        df: DataFrame with 'Mois', 'Plage', 'Production_kW',
+            'Consommation_kW', 'Duree_h' (and optionally 'Deficit_kW') columns
+
+    Returns:
+        Dict mapping month names (in df order) to their NightSlot
+    """
+    # Positions of the first nighttime row of each month, without building
+    # intermediate DataFrames
+    rows = np.flatnonzero(df['Plage'].to_numpy() == '23h-8h')
+    _, first = np.unique(df['Mois'].to_numpy()[rows], return_index=True)
+    rows = rows[np.sort(first)]
+
+    def column(name):
+        return df[name].to_numpy()[rows]
+
+    prod = column('Production_kW').astype(np.float64)
+    conso = column('Consommation_kW').astype(np.float64)
+    deficit = (column('Deficit_kW').astype(np.float64)
+               if 'Deficit_kW' in df else conso - prod)
+    return dict(zip(
+        column('Mois').tolist(),
+        map(NightSlot, prod.tolist(), conso.tolist(), deficit.tolist(),
+            column('Duree_h').tolist()),
+    ))
 
 
 def calculate_solar_capacity_factors(
@@ -64,31 +106,59 @@ def calculate_solar_capacity_factors(
         config = DEFAULT_CONFIG
 
     solar_capacity_kw = config.production.solar_capacity_gwc * 1e6
-    solar_cf = {}
 
-    for _, row in df.iterrows():
-        mois = row['Mois']
-        plage = row['Plage']
-
-        # Skip nighttime slots (no solar)
-        if plage == '23h-8h':
-            continue
-
-        base = base_prod_by_month.get(mois, 50e6)
-        total_prod = row['Production_kW']
-        solar_prod = max(0, total_prod - base)
+    # Skip nighttime slots (no solar)
+    day = df[df['Plage'] != '23h-8h']
+    mois_arr = day['Mois'].to_numpy()
+
+    # Base production looked up once per distinct month, then by month code
+    mois_cat = day['Mois'].astype('category').cat
+    base_by_mois = np.array(
+        [base_prod_by_month.get(m, 50e6) for m in mois_cat.categories], dtype=np.float64
+    )
+    base = base_by_mois[mois_cat.codes]
+    solar_prod = np.maximum(0.0, day['Production_kW'].to_numpy(dtype=np.float64) - base)
+
+    # Capacity factor = solar production / installed capacity
+    if solar_capacity_kw > 0:
+        cf = solar_prod / solar_capacity_kw
+    else:
+        cf = np.zeros_like(solar_prod)
+
+    return {
+        (mois, plage): {'cf': c, 'base_prod': b, 'conso': conso, 'duree': duree}
+        for mois, plage, c, b, conso, duree in zip(
+            mois_arr, day['Plage'].to_numpy(), cf.tolist(), base.tolist(),
+            day['Consommation_kW'].tolist(), day['Duree_h'].tolist(),
+        )
+    }
+
+
+# Columnar layout of calculate_solar_capacity_factors output, one record per slot
+SOLAR_CF_DTYPE = np.dtype([
+    ('mois', 'U12'), ('plage', 'U8'),
+    ('cf', 'f8'), ('base_prod', 'f8'), ('conso', 'f8'), ('duree', 'f8'),
+])
+
+
+def solar_cf_to_array(solar_cf: Dict[Tuple[str, str], Dict]) -> np.ndarray:
+    """
+    Pack capacity factor data into a structured array (see SOLAR_CF_DTYPE).
 
-        # Capacity factor = solar production / installed capacity
-        cf = solar_prod / solar_capacity_kw if solar_capacity_kw > 0 else 0
+    Consumers read whole columns (e.g. arr['cf']) instead of walking the
+    dict slot by slot.
 
-        solar_cf[(mois, plage)] = {
-            'cf': cf,
-            'base_prod': base,
-            'conso': row['Consommation_kW'],
-            'duree': row['Duree_h']
-        }
+    Args:
+        solar_cf: Capacity factor data from calculate_solar_capacity_factors
 
-    return solar_cf
+    Returns:
+        Structured array with one record per (month, slot), in dict order
+    """
+    return np.fromiter(
+        ((mois, plage, d['cf'], d['base_prod'], d['conso'], d['duree'])
+         for (mois, plage), d in solar_cf.items()),
+        dtype=SOLAR_CF_DTYPE, count=len(solar_cf),
+    )
 
 
 def scale_production(
@@ -111,23 +181,32 @@ def scale_production(
         Dict with scaled production data for each (month, slot)
     """
     new_capacity_kw = new_capacity_gwc * 1e6
-    scaled = {}
 
-    for (mois, plage), data in solar_cf.items():
-        new_solar_kw = data['cf'] * new_capacity_kw
-        new_total_prod = data['base_prod'] + new_solar_kw
+    # One column per field, scaled in a few vectorized passes
+    slots = solar_cf_to_array(solar_cf)
+    conso = slots['conso']
 
-        scaled[(mois, plage)] = {
-            'production_kw': new_total_prod,
-            'solar_kw': new_solar_kw,
+    new_solar_kw = slots['cf'] * new_capacity_kw
+    new_total_prod = slots['base_prod'] + new_solar_kw
+    balance = new_total_prod - conso
+    surplus = np.maximum(0.0, balance)
+    deficit = surplus - balance  # == max(0, -balance), without a second pass
+
+    return {
+        key: {
+            'production_kw': prod,
+            'solar_kw': solar,
             'base_kw': data['base_prod'],
             'conso_kw': data['conso'],
             'duree': data['duree'],
-            'deficit_kw': max(0, data['conso'] - new_total_prod),
-            'surplus_kw': max(0, new_total_prod - data['conso']),
+            'deficit_kw': d,
+            'surplus_kw': s,
         }
-
-    return scaled
+        for (key, data), prod, solar, d, s in zip(
+            solar_cf.items(), new_total_prod.tolist(), new_solar_kw.tolist(),
+            deficit.tolist(), surplus.tolist(),
+        )
+    }
 
 
 def detect_production_anomalies(
@@ -154,28 +233,24 @@ def detect_production_anomalies(
     prod_base_max = config.production.prod_base_max_gw * 1e6  # Convert to kW
     prod_solaire_max = config.production.prod_solaire_max_gw * 1e6
 
-    anomalies = []
-
-    for _, row in df.iterrows():
-        prod_kw = row['Production_kW']
-        plage = row['Plage']
-        mois = row['Mois']
-
-        # Calculate expected maximum production
-        fraction_soleil = fraction_solaire_attendue(mois, plage, config)
-        prod_max_kw = prod_base_max + fraction_soleil * prod_solaire_max
-
-        # Check for anomaly (with 20 GW margin)
-        margin_kw = 20e6
-        if prod_kw > prod_max_kw + margin_kw:
-            anomalies.append({
-                'Mois': mois,
-                'Plage': plage,
-                'Production_GW': prod_kw / 1e6,
-                'Attendu_max_GW': prod_max_kw / 1e6,
-                'Ecart_GW': (prod_kw - prod_max_kw) / 1e6,
-                'Fraction_soleil': fraction_soleil,
-                'Sunset': config.temporal.sunset_times.get(mois, 18.0),
-            })
-
-    return pd.DataFrame(anomalies)
+    mois_arr = df['Mois'].to_numpy()
+    plage_arr = df['Plage'].to_numpy()
+    prod_kw = df['Production_kW'].to_numpy(dtype=np.float64)
+
+    fraction_soleil = fraction_solaire_df(df, config=config)
+    prod_max_kw = prod_base_max + fraction_soleil * prod_solaire_max
+
+    # Check for anomaly (with 20 GW margin)
+    margin_kw = 20e6
+    mask = prod_kw > prod_max_kw + margin_kw
+    sunset_times = config.temporal.sunset_times
+
+    return pd.DataFrame({
+        'Mois': mois_arr[mask],
+        'Plage': plage_arr[mask],
+        'Production_GW': prod_kw[mask] / 1e6,
+        'Attendu_max_GW': prod_max_kw[mask] / 1e6,
+        'Ecart_GW': (prod_kw[mask] - prod_max_kw[mask]) / 1e6,
+        'Fraction_soleil': fraction_soleil[mask],
+        'Sunset': [sunset_times.get(mois, 18.0) for mois in mois_arr[mask]],
+    })
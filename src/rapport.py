@@ -8,7 +8,9 @@ factuel et transparent sur les hypotheses utilisees.
 Issue: energy_transition-4yf
 """
 
-from typing import Optional
+from functools import lru_cache
+from string import Template
+from typing import Dict, Iterator, Optional
 
 from src.config import EnergyModelConfig, DEFAULT_CONFIG
 from src.emissions import bilan_carbone, resume_emissions
@@ -21,33 +23,152 @@ from src.trajectory import (
 )
 
 
+# ---------------------------------------------------------------------------
+# Static text
+# ---------------------------------------------------------------------------
+
+_BAR = "=" * 60
+
+_TITRE = (
+    _BAR
+    + "\n  RAPPORT DE SYNTHESE"
+    + "\n  Modele de transition energetique - France"
+    + "\n  Scenario : 500 GWc solaire + electrification"
+    + "\n" + _BAR
+)
+
+_PIED = (
+    "\n" + _BAR
+    + "\n  Fin du rapport"
+    + "\n  Modele v0.5 - Donnees sources documentees dans SOURCES.md"
+    + "\n" + _BAR
+)
+
+_CONTEXTE = (
+    "La France s'est engagee a atteindre la neutralite carbone d'ici 2050\n"
+    "(Strategie Nationale Bas Carbone). Cela implique une electrification\n"
+    "massive du chauffage et du transport, aujourd'hui largement dependants\n"
+    "des energies fossiles.\n"
+    "\n"
+    "Ce modele evalue la faisabilite physique et economique d'un scenario\n"
+    "base sur un deploiement massif de solaire photovoltaique (500 GWc),\n"
+    "le maintien du parc nucleaire et hydraulique existant, et le recours\n"
+    "au gaz naturel comme source de backup pour les periodes sans soleil.\n"
+    "\n"
+    "L'objectif est de fournir des ordres de grandeur fiables pour eclairer\n"
+    "les choix publics, en rendant toutes les hypotheses explicites et\n"
+    "verifiables."
+)
+
+_NOTES_HYPOTHESES = (
+    "\nNotes :\n"
+    "- L'eolien n'est pas inclus (hypothese conservative).\n"
+    "- Le stockage intersaisonnier (hydrogene, STEP) n'est pas modelise.\n"
+    "- Les interconnexions europeennes ne sont pas prises en compte.\n"
+    "- La flexibilite de la demande (effacement, V2G) est ignoree."
+)
+
+# Hypotheses table frame
+_HYP_SEP = "+" + "-" * 42 + "+" + "-" * 22 + "+" + "-" * 30 + "+"
+_HYP_HEADER = f"| {'Parametre':<40} | {'Valeur':>20} | {'Source':<28} |"
+_HYP_ROW = "| {:<40} | {:>20} | {:<28} |".format
+
+# Section 8
+_LIMITES = (
+    "Ce modele presente plusieurs limites importantes :\n"
+    "\n"
+    "- Pas de stockage intersaisonnier : les batteries, le pompage-turbinage\n"
+    "  (STEP) et l'hydrogene ne sont pas modelises. Leur inclusion reduirait\n"
+    "  significativement le besoin en gaz de backup.\n"
+    "\n"
+    "- Pas d'eolien : le vent, complementaire du solaire (production hivernale\n"
+    "  accrue), n'est pas pris en compte. Son ajout ameliorerait le bilan.\n"
+    "\n"
+    "- Pas d'interconnexions europeennes : les echanges transfrontaliers\n"
+    "  permettraient un lissage supplementaire.\n"
+    "\n"
+    "- Pas de flexibilite de la demande : l'effacement, la recharge\n"
+    "  intelligente des vehicules (V2G) et la gestion thermique des\n"
+    "  batiments ne sont pas integres.\n"
+    "\n"
+    "- Granularite temporelle limitee : le modele utilise 12 mois x 5\n"
+    "  creneaux horaires (60 periodes), sans variabilite intra-journaliere\n"
+    "  fine ni evenements meteorologiques extremes.\n"
+    "\n"
+    "- COP des pompes a chaleur : le COP moyen utilise est conservateur.\n"
+    "  Les pompes geothermiques offrent des performances superieures.\n"
+    "\n"
+    "Ces limites rendent les resultats conservateurs : le besoin reel\n"
+    "en gaz de backup serait probablement inferieur aux estimations."
+)
+
+# Section 9, substituted with pre-rounded $gaz (TWh), $red (%) and $inv (Mds EUR)
+_RECOMMANDATIONS = Template(
+    "Sur la base des resultats du modele, les elements suivants meritent\n"
+    "l'attention des decideurs :\n"
+    "\n"
+    "1. Faisabilite physique : le scenario 500 GWc solaire avec maintien\n"
+    "   du nucleaire et de l'hydraulique couvre l'essentiel de la demande.\n"
+    "   Le complement gaz (environ $gaz TWh/an) reste significatif\n"
+    "   mais represente une fraction limitee du mix.\n"
+    "\n"
+    "2. Reduction des emissions : la transition permet une reduction\n"
+    "   estimee a environ $red % des emissions nationales, principalement\n"
+    "   grace a l'electrification du transport et du chauffage.\n"
+    "\n"
+    "3. Investissement : le deploiement solaire represente un investissement\n"
+    "   cumule de l'ordre de $inv Mds EUR sur la periode 2024-2050.\n"
+    "   Les courbes d'apprentissage suggerent une baisse continue des couts.\n"
+    "\n"
+    "4. Axes d'amelioration : l'ajout d'eolien, de stockage intersaisonnier\n"
+    "   et de flexibilite de la demande permettrait de reduire davantage\n"
+    "   le recours au gaz de backup.\n"
+    "\n"
+    "5. Robustesse : les hypotheses sont deliberement conservatives.\n"
+    "   Les resultats constituent donc une borne superieure du besoin\n"
+    "   en gaz de backup."
+)
+
+
 # ---------------------------------------------------------------------------
 # Section generators
 # ---------------------------------------------------------------------------
 
-def generer_resume_executif(gaz_twh: float) -> str:
+def generer_resume_executif(
+    gaz_twh: float,
+    bilan: Optional[Dict[str, float]] = None,
+    chauffage: Optional[Dict] = None,
+    investissement: Optional[float] = None,
+) -> str:
     """
     Generate a concise executive summary (< 500 characters).
 
     Args:
         gaz_twh: Annual gas backup in TWh.
+        bilan: Precomputed bilan_carbone(gaz_twh) (computed if None).
+        chauffage: Precomputed bilan_chauffage_annuel() (computed if None).
+        investissement: Precomputed cumulative investment in EUR billions
+            (computed if None).
 
     Returns:
         Short executive summary string in French.
     """
-    bilan = bilan_carbone(gaz_twh)
-    chauffage = bilan_chauffage_annuel()
+    if bilan is None:
+        bilan = bilan_carbone(gaz_twh)
+    if chauffage is None:
+        chauffage = bilan_chauffage_annuel()
+    if investissement is None:
+        investissement = _investissement_cumule()
     total_chauffage_twh = chauffage["_total"]["energie_annuelle_twh"]
 
-    lines = [
-        f"Le scenario 500 GWc solaire necessite {gaz_twh:.0f} TWh/an de gaz de backup.",
-        f"Le chauffage electrifie represente {total_chauffage_twh:.0f} TWh/an.",
+    return (
+        f"Le scenario 500 GWc solaire necessite {gaz_twh:.0f} TWh/an de gaz de backup.\n"
+        f"Le chauffage electrifie represente {total_chauffage_twh:.0f} TWh/an.\n"
         f"Les emissions nationales passent de {bilan['france_actuelle_mt']:.0f} a {bilan['scenario_total_mt']:.0f} MtCO2/an "
-        f"(reduction de {bilan['reduction_pct']:.0f} %).",
-        f"L'investissement solaire cumule sur 2024-2050 est estime a {_investissement_cumule():.0f} Mds EUR.",
-        "L'eolien et le stockage intersaisonnier ne sont pas inclus (hypothese conservative).",
-    ]
-    return "\n".join(lines)
+        f"(reduction de {bilan['reduction_pct']:.0f} %).\n"
+        f"L'investissement solaire cumule sur 2024-2050 est estime a {investissement:.0f} Mds EUR.\n"
+        "L'eolien et le stockage intersaisonnier ne sont pas inclus (hypothese conservative)."
+    )
 
 
 def generer_tableau_hypotheses(
@@ -65,9 +186,6 @@ def generer_tableau_hypotheses(
     if config is None:
         config = DEFAULT_CONFIG
 
-    sep = "+" + "-" * 42 + "+" + "-" * 22 + "+" + "-" * 30 + "+"
-    header = f"| {'Parametre':<40} | {'Valeur':>20} | {'Source':<28} |"
-
     rows = [
         ("Capacite solaire PV", f"{config.production.solar_capacity_gwc:.0f} GWc", "Hypothese scenario"),
         ("Capacite solaire actuelle", f"{config.production.solar_capacity_current_gwc:.0f} GWc", "RTE 2024"),
@@ -83,54 +201,61 @@ def generer_tableau_hypotheses(
         ("Horizon d'analyse", f"{config.financial.analysis_horizon_years} ans", "Hypothese modele"),
     ]
 
-    lines = [sep, header, sep]
-    for param, valeur, source in rows:
-        lines.append(f"| {param:<40} | {valeur:>20} | {source:<28} |")
-    lines.append(sep)
+    return "\n".join((
+        _HYP_SEP, _HYP_HEADER, _HYP_SEP,
+        *(_HYP_ROW(*row) for row in rows),
+        _HYP_SEP,
+    ))
 
-    return "\n".join(lines)
 
-
-def generer_section_resultats(gaz_twh: float) -> str:
+def generer_section_resultats(
+    gaz_twh: float,
+    bilan: Optional[Dict[str, float]] = None,
+    chauffage: Optional[Dict] = None,
+) -> str:
     """
     Generate the key results section.
 
     Args:
         gaz_twh: Annual gas backup in TWh.
+        bilan: Precomputed bilan_carbone(gaz_twh) (computed if None).
+        chauffage: Precomputed bilan_chauffage_annuel() (computed if None).
 
     Returns:
         Formatted results section string.
     """
-    bilan = bilan_carbone(gaz_twh)
-    chauffage = bilan_chauffage_annuel()
+    if bilan is None:
+        bilan = bilan_carbone(gaz_twh)
+    if chauffage is None:
+        chauffage = bilan_chauffage_annuel()
     total_chauffage_twh = chauffage["_total"]["energie_annuelle_twh"]
 
-    lines = [
-        "Resultats cles",
-        "-" * 40,
-        "",
-        "Bilan energetique:",
-        f"  Gaz de backup necessaire :     {gaz_twh:.0f} TWh/an",
-        f"  Chauffage electrifie :         {total_chauffage_twh:.1f} TWh/an",
-        "",
-        "Bilan carbone:",
-        f"  Emissions actuelles France :   {bilan['france_actuelle_mt']:.0f} MtCO2/an",
-        f"  Emissions apres transition :   {bilan['scenario_total_mt']:.0f} MtCO2/an",
-        f"  Reduction :                    {bilan['reduction_mt']:.0f} MtCO2 ({bilan['reduction_pct']:.0f} %)",
-        f"  Emissions evitees transport :  {bilan['evitees_transport_mt']:.0f} MtCO2",
-        f"  Emissions evitees batiments :  {bilan['evitees_batiments_mt']:.0f} MtCO2",
-        "",
-        "Comparaison aux objectifs SNBC:",
-        f"  Objectif 2030 (270 Mt) :       {bilan['vs_objectif_2030_mt']:+.0f} MtCO2",
-        f"  Objectif 2050 (80 Mt) :        {bilan['vs_objectif_2050_mt']:+.0f} MtCO2",
-    ]
-    return "\n".join(lines)
+    return (
+        "Resultats cles\n"
+        f"{'-' * 40}\n"
+        "\n"
+        "Bilan energetique:\n"
+        f"  Gaz de backup necessaire :     {gaz_twh:.0f} TWh/an\n"
+        f"  Chauffage electrifie :         {total_chauffage_twh:.1f} TWh/an\n"
+        "\n"
+        "Bilan carbone:\n"
+        f"  Emissions actuelles France :   {bilan['france_actuelle_mt']:.0f} MtCO2/an\n"
+        f"  Emissions apres transition :   {bilan['scenario_total_mt']:.0f} MtCO2/an\n"
+        f"  Reduction :                    {bilan['reduction_mt']:.0f} MtCO2 ({bilan['reduction_pct']:.0f} %)\n"
+        f"  Emissions evitees transport :  {bilan['evitees_transport_mt']:.0f} MtCO2\n"
+        f"  Emissions evitees batiments :  {bilan['evitees_batiments_mt']:.0f} MtCO2\n"
+        "\n"
+        "Comparaison aux objectifs SNBC:\n"
+        f"  Objectif 2030 (270 Mt) :       {bilan['vs_objectif_2030_mt']:+.0f} MtCO2\n"
+        f"  Objectif 2050 (80 Mt) :        {bilan['vs_objectif_2050_mt']:+.0f} MtCO2"
+    )
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def _investissement_cumule() -> float:
     """Return cumulative solar investment in EUR billions from trajectory."""
     traj = calculer_trajectoire()
@@ -139,168 +264,110 @@ def _investissement_cumule() -> float:
     return 0.0
 
 
+@lru_cache(maxsize=32)
 def _section_titre(titre: str) -> str:
     """Return a formatted section title."""
-    return f"\n{'=' * 60}\n  {titre}\n{'=' * 60}\n"
+    return f"\n{_BAR}\n  {titre}\n{_BAR}\n"
 
 
 # ---------------------------------------------------------------------------
 # Main report generator
 # ---------------------------------------------------------------------------
 
-def generer_rapport(
+def iter_rapport(
     gaz_twh: float,
     config: Optional[EnergyModelConfig] = None,
-) -> str:
+) -> Iterator[str]:
     """
-    Generate complete decision-maker report as formatted text.
+    Yield the decision-maker report section by section.
 
-    The report is structured, factual and in French. It presents
-    the model results without advocacy, letting decision-makers
-    draw their own conclusions.
+    Sections are produced lazily, so a caller writing to a file or a
+    response can stream them without building the whole report; join
+    them with newlines to get the text returned by generer_rapport().
 
     Args:
         gaz_twh: Annual gas backup in TWh.
         config: Model configuration (uses defaults if None).
 
-    Returns:
-        Complete formatted report as a single string.
+    Yields:
+        Report blocks (title banner, section titles, section bodies).
     """
     if config is None:
         config = DEFAULT_CONFIG
 
-    sections: list[str] = []
+    # Shared results, computed once for all sections
+    bilan = bilan_carbone(gaz_twh)
+    chauffage = bilan_chauffage_annuel()
+    investissement = _investissement_cumule()
 
     # ---- Title ----
-    sections.append(
-        "=" * 60
-        + "\n  RAPPORT DE SYNTHESE"
-        + "\n  Modele de transition energetique - France"
-        + "\n  Scenario : 500 GWc solaire + electrification"
-        + "\n" + "=" * 60
-    )
+    yield _TITRE
 
     # ---- 1. Resume executif ----
-    sections.append(_section_titre("1. Resume executif"))
-    sections.append(generer_resume_executif(gaz_twh))
+    yield _section_titre("1. Resume executif")
+    yield generer_resume_executif(gaz_twh, bilan, chauffage, investissement)
 
     # ---- 2. Contexte et objectifs ----
-    sections.append(_section_titre("2. Contexte et objectifs"))
-    sections.append(
-        "La France s'est engagee a atteindre la neutralite carbone d'ici 2050\n"
-        "(Strategie Nationale Bas Carbone). Cela implique une electrification\n"
-        "massive du chauffage et du transport, aujourd'hui largement dependants\n"
-        "des energies fossiles.\n"
-        "\n"
-        "Ce modele evalue la faisabilite physique et economique d'un scenario\n"
-        "base sur un deploiement massif de solaire photovoltaique (500 GWc),\n"
-        "le maintien du parc nucleaire et hydraulique existant, et le recours\n"
-        "au gaz naturel comme source de backup pour les periodes sans soleil.\n"
-        "\n"
-        "L'objectif est de fournir des ordres de grandeur fiables pour eclairer\n"
-        "les choix publics, en rendant toutes les hypotheses explicites et\n"
-        "verifiables."
-    )
+    yield _section_titre("2. Contexte et objectifs")
+    yield _CONTEXTE
 
     # ---- 3. Hypotheses principales ----
-    sections.append(_section_titre("3. Hypotheses principales"))
-    sections.append(generer_tableau_hypotheses(config))
-    sections.append(
-        "\nNotes :\n"
-        "- L'eolien n'est pas inclus (hypothese conservative).\n"
-        "- Le stockage intersaisonnier (hydrogene, STEP) n'est pas modelise.\n"
-        "- Les interconnexions europeennes ne sont pas prises en compte.\n"
-        "- La flexibilite de la demande (effacement, V2G) est ignoree."
-    )
+    yield _section_titre("3. Hypotheses principales")
+    yield generer_tableau_hypotheses(config)
+    yield _NOTES_HYPOTHESES
 
     # ---- 4. Resultats cles ----
-    sections.append(_section_titre("4. Resultats cles"))
-    sections.append(generer_section_resultats(gaz_twh))
+    yield _section_titre("4. Resultats cles")
+    yield generer_section_resultats(gaz_twh, bilan, chauffage)
 
     # ---- 5. Chauffage ----
-    sections.append(_section_titre("5. Chauffage"))
-    sections.append(resume_chauffage())
+    yield _section_titre("5. Chauffage")
+    yield resume_chauffage()
 
     # ---- 5b. Transport ----
-    sections.append(_section_titre("5b. Transport"))
-    sections.append(resume_transport())
+    yield _section_titre("5b. Transport")
+    yield resume_transport()
 
     # ---- 6. Bilan carbone ----
-    sections.append(_section_titre("6. Bilan carbone"))
-    sections.append(resume_emissions(gaz_twh))
+    yield _section_titre("6. Bilan carbone")
+    yield resume_emissions(gaz_twh)
 
     # ---- 7. Trajectoire ----
-    sections.append(_section_titre("7. Trajectoire 2024-2050"))
-    sections.append(resume_trajectoire())
+    yield _section_titre("7. Trajectoire 2024-2050")
+    yield resume_trajectoire()
 
     # ---- 8. Limites et incertitudes ----
-    sections.append(_section_titre("8. Limites et incertitudes"))
-    sections.append(
-        "Ce modele presente plusieurs limites importantes :\n"
-        "\n"
-        "- Pas de stockage intersaisonnier : les batteries, le pompage-turbinage\n"
-        "  (STEP) et l'hydrogene ne sont pas modelises. Leur inclusion reduirait\n"
-        "  significativement le besoin en gaz de backup.\n"
-        "\n"
-        "- Pas d'eolien : le vent, complementaire du solaire (production hivernale\n"
-        "  accrue), n'est pas pris en compte. Son ajout ameliorerait le bilan.\n"
-        "\n"
-        "- Pas d'interconnexions europeennes : les echanges transfrontaliers\n"
-        "  permettraient un lissage supplementaire.\n"
-        "\n"
-        "- Pas de flexibilite de la demande : l'effacement, la recharge\n"
-        "  intelligente des vehicules (V2G) et la gestion thermique des\n"
-        "  batiments ne sont pas integres.\n"
-        "\n"
-        "- Granularite temporelle limitee : le modele utilise 12 mois x 5\n"
-        "  creneaux horaires (60 periodes), sans variabilite intra-journaliere\n"
-        "  fine ni evenements meteorologiques extremes.\n"
-        "\n"
-        "- COP des pompes a chaleur : le COP moyen utilise est conservateur.\n"
-        "  Les pompes geothermiques offrent des performances superieures.\n"
-        "\n"
-        "Ces limites rendent les resultats conservateurs : le besoin reel\n"
-        "en gaz de backup serait probablement inferieur aux estimations."
-    )
+    yield _section_titre("8. Limites et incertitudes")
+    yield _LIMITES
 
     # ---- 9. Recommandations ----
-    sections.append(_section_titre("9. Recommandations"))
-    sections.append(
-        "Sur la base des resultats du modele, les elements suivants meritent\n"
-        "l'attention des decideurs :\n"
-        "\n"
-        "1. Faisabilite physique : le scenario 500 GWc solaire avec maintien\n"
-        "   du nucleaire et de l'hydraulique couvre l'essentiel de la demande.\n"
-        "   Le complement gaz (environ {gaz:.0f} TWh/an) reste significatif\n"
-        "   mais represente une fraction limitee du mix.\n"
-        "\n"
-        "2. Reduction des emissions : la transition permet une reduction\n"
-        "   estimee a environ {red:.0f} % des emissions nationales, principalement\n"
-        "   grace a l'electrification du transport et du chauffage.\n"
-        "\n"
-        "3. Investissement : le deploiement solaire represente un investissement\n"
-        "   cumule de l'ordre de {inv:.0f} Mds EUR sur la periode 2024-2050.\n"
-        "   Les courbes d'apprentissage suggerent une baisse continue des couts.\n"
-        "\n"
-        "4. Axes d'amelioration : l'ajout d'eolien, de stockage intersaisonnier\n"
-        "   et de flexibilite de la demande permettrait de reduire davantage\n"
-        "   le recours au gaz de backup.\n"
-        "\n"
-        "5. Robustesse : les hypotheses sont deliberement conservatives.\n"
-        "   Les resultats constituent donc une borne superieure du besoin\n"
-        "   en gaz de backup.".format(
-            gaz=gaz_twh,
-            red=bilan_carbone(gaz_twh)["reduction_pct"],
-            inv=_investissement_cumule(),
-        )
+    yield _section_titre("9. Recommandations")
+    yield _RECOMMANDATIONS.substitute(
+        gaz=f"{gaz_twh:.0f}",
+        red=f"{bilan['reduction_pct']:.0f}",
+        inv=f"{investissement:.0f}",
     )
 
     # ---- Footer ----
-    sections.append(
-        "\n" + "=" * 60
-        + "\n  Fin du rapport"
-        + "\n  Modele v0.5 - Donnees sources documentees dans SOURCES.md"
-        + "\n" + "=" * 60
-    )
+    yield _PIED
+
+
+def generer_rapport(
+    gaz_twh: float,
+    config: Optional[EnergyModelConfig] = None,
+) -> str:
+    """
+    Generate complete decision-maker report as formatted text.
+
+    The report is structured, factual and in French. It presents
+    the model results without advocacy, letting decision-makers
+    draw their own conclusions.
+
+    Args:
+        gaz_twh: Annual gas backup in TWh.
+        config: Model configuration (uses defaults if None).
 
-    return "\n".join(sections)
+    Returns:
+        Complete formatted report as a single string.
+    """
+    return "\n".join(iter_rapport(gaz_twh, config))
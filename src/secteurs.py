@@ -11,11 +11,16 @@ Sources:
 - RTE Futurs Énergétiques 2050
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
+import numpy as np
 
-@dataclass
+from .balayage import champs_balayage
+
+
+@dataclass(frozen=True, slots=True)
 class IndustrieConfig:
     """Industrial sector energy parameters."""
 
@@ -61,7 +66,7 @@ class IndustrieConfig:
     gain_efficacite_fraction: float = 0.15
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TertiaireConfig:
     """Tertiary sector energy parameters."""
 
@@ -101,7 +106,12 @@ class TertiaireConfig:
     climatisation_gain: float = 0.20
 
 
-def bilan_industrie(config: Optional[IndustrieConfig] = None) -> Dict[str, float]:
+# Default configurations, shared (instances are immutable)
+_DEFAULT_IND = IndustrieConfig()
+_DEFAULT_TER = TertiaireConfig()
+
+
+def bilan_industrie(config: Optional[IndustrieConfig] = None) -> Mapping[str, float]:
     """
     Calculate industrial sector energy balance after electrification.
 
@@ -109,10 +119,16 @@ def bilan_industrie(config: Optional[IndustrieConfig] = None) -> Dict[str, float
         config: Industry configuration
 
     Returns:
-        Dict with current vs electrified consumption
+        Read-only mapping of current vs electrified consumption (for the
+        default config, a shared one computed at import)
     """
     if config is None:
-        config = IndustrieConfig()
+        return _DEFAULT_IND_BILAN
+    return MappingProxyType(_calcul_bilan_industrie(config))
+
+
+def _calcul_bilan_industrie(config) -> Dict:
+    """Industry balance arithmetic on config fields (floats or arrays)."""
 
     # Current total
     actuel_total = (config.chaleur_haute_temp_twh + config.chaleur_moyenne_temp_twh +
@@ -162,7 +178,7 @@ def bilan_industrie(config: Optional[IndustrieConfig] = None) -> Dict[str, float
     }
 
 
-def bilan_tertiaire(config: Optional[TertiaireConfig] = None) -> Dict[str, float]:
+def bilan_tertiaire(config: Optional[TertiaireConfig] = None) -> Mapping[str, float]:
     """
     Calculate tertiary sector energy balance after electrification.
 
@@ -170,10 +186,16 @@ def bilan_tertiaire(config: Optional[TertiaireConfig] = None) -> Dict[str, float
         config: Tertiary configuration
 
     Returns:
-        Dict with current vs electrified consumption
+        Read-only mapping of current vs electrified consumption (for the
+        default config, a shared one computed at import)
     """
     if config is None:
-        config = TertiaireConfig()
+        return _DEFAULT_TER_BILAN
+    return MappingProxyType(_calcul_bilan_tertiaire(config))
+
+
+def _calcul_bilan_tertiaire(config) -> Dict:
+    """Tertiary balance arithmetic on config fields (floats or arrays)."""
 
     actuel_total = (config.chauffage_twh + config.climatisation_twh +
                     config.eclairage_twh + config.electricite_specifique_twh +
@@ -214,24 +236,68 @@ def bilan_tertiaire(config: Optional[TertiaireConfig] = None) -> Dict[str, float
     }
 
 
+def bilan_industrie_sweep(**valeurs) -> Dict[str, np.ndarray]:
+    """
+    Industrial balance over arrays of parameter values, without configs.
+
+    Fields not given keep their IndustrieConfig default; the given arrays
+    broadcast against each other (e.g. a meshgrid for a 2-D sweep). For a
+    list of configs, pass every field stacked across them.
+
+    Args:
+        **valeurs: IndustrieConfig field name -> array of values
+
+    Returns:
+        Same keys as bilan_industrie, each a broadcast array (or a float
+        for quantities that do not depend on the swept fields)
+    """
+    return _calcul_bilan_industrie(champs_balayage(_DEFAULT_IND, valeurs))
+
+
+def bilan_tertiaire_sweep(**valeurs) -> Dict[str, np.ndarray]:
+    """
+    Tertiary balance over arrays of parameter values, without configs.
+
+    Args:
+        **valeurs: TertiaireConfig field name -> array of values
+
+    Returns:
+        Same keys as bilan_tertiaire, each a broadcast array (or a float
+        for quantities that do not depend on the swept fields)
+    """
+    return _calcul_bilan_tertiaire(champs_balayage(_DEFAULT_TER, valeurs))
+
+
+# Default-config balances, evaluated once at import
+_DEFAULT_IND_BILAN = MappingProxyType(_calcul_bilan_industrie(_DEFAULT_IND))
+_DEFAULT_TER_BILAN = MappingProxyType(_calcul_bilan_tertiaire(_DEFAULT_TER))
+
+
 def bilan_tous_secteurs(
     industrie_config: Optional[IndustrieConfig] = None,
     tertiaire_config: Optional[TertiaireConfig] = None,
-) -> Dict[str, float]:
+    *,
+    ind: Optional[Mapping[str, float]] = None,
+    ter: Optional[Mapping[str, float]] = None,
+) -> Mapping[str, float]:
     """
     Combined balance for industry + tertiary.
 
     Args:
         industrie_config: Industry configuration
         tertiaire_config: Tertiary configuration
+        ind: Already computed bilan_industrie (skips recomputation)
+        ter: Already computed bilan_tertiaire (skips recomputation)
 
     Returns:
-        Combined sector balance
+        Combined sector balance (read-only mapping)
     """
-    ind = bilan_industrie(industrie_config)
-    ter = bilan_tertiaire(tertiaire_config)
+    if ind is None:
+        ind = bilan_industrie(industrie_config)
+    if ter is None:
+        ter = bilan_tertiaire(tertiaire_config)
 
-    return {
+    return MappingProxyType({
         'industrie_actuel_twh': ind['actuel_total_twh'],
         'industrie_elec_twh': ind['total_elec_twh'],
         'industrie_fossile_twh': ind['fossile_residuel_twh'],
@@ -240,7 +306,37 @@ def bilan_tous_secteurs(
         'total_actuel_twh': ind['actuel_total_twh'] + ter['actuel_total_twh'],
         'total_elec_twh': ind['total_elec_twh'] + ter['total_elec_twh'],
         'total_fossile_residuel_twh': ind['fossile_residuel_twh'],
-    }
+    })
+
+
+# resume_secteurs rows: (label, balance key), one "label value TWh" line each
+_LIGNE = "  {:<23}{:>6.1f} TWh{}".format
+_IND_ROWS = (
+    ("Actuel total:", 'actuel_total_twh'),
+    ("Chaleur haute T (élec):", 'chaleur_ht_elec_twh'),
+    ("Chaleur haute T (foss):", 'chaleur_ht_fossile_twh'),
+    ("Chaleur moy. T (PAC):", 'chaleur_mt_elec_twh'),
+    ("Chaleur basse T (PAC):", 'chaleur_bt_elec_twh'),
+    ("Force motrice:", 'force_motrice_twh'),
+    ("Électrochimie:", 'electrochimie_twh'),
+    ("Gain efficacité:", 'gain_efficacite_twh'),
+    ("TOTAL élec:", 'total_elec_twh'),
+)
+_IND_SUFFIXES = {'chaleur_ht_fossile_twh': " (non-électrifiable)"}
+_TER_ROWS = (
+    ("Actuel total:", 'actuel_total_twh'),
+    ("Chauffage (rénové+PAC):", 'chauffage_elec_twh'),
+    ("Climatisation:", 'climatisation_twh'),
+    ("Éclairage (LED):", 'eclairage_twh'),
+    ("Élec. spécifique:", 'electricite_specifique_twh'),
+    ("Eau chaude:", 'eau_chaude_twh'),
+    ("TOTAL élec:", 'total_elec_twh'),
+)
+_TOTAL_ROWS = (
+    ("Actuel (ind+tert):", 'total_actuel_twh'),
+    ("Électrifié:", 'total_elec_twh'),
+    ("Fossile résiduel:", 'total_fossile_residuel_twh'),
+)
 
 
 def resume_secteurs(
@@ -259,37 +355,20 @@ def resume_secteurs(
     """
     ind = bilan_industrie(industrie_config)
     ter = bilan_tertiaire(tertiaire_config)
-    total = bilan_tous_secteurs(industrie_config, tertiaire_config)
-
-    lines = [
-        "Secteurs Industrie et Tertiaire",
-        "=" * 45,
-        "",
-        "INDUSTRIE",
-        f"  Actuel total:          {ind['actuel_total_twh']:>6.1f} TWh",
-        f"  Chaleur haute T (élec):{ind['chaleur_ht_elec_twh']:>6.1f} TWh",
-        f"  Chaleur haute T (foss):{ind['chaleur_ht_fossile_twh']:>6.1f} TWh (non-électrifiable)",
-        f"  Chaleur moy. T (PAC):  {ind['chaleur_mt_elec_twh']:>6.1f} TWh",
-        f"  Chaleur basse T (PAC): {ind['chaleur_bt_elec_twh']:>6.1f} TWh",
-        f"  Force motrice:         {ind['force_motrice_twh']:>6.1f} TWh",
-        f"  Électrochimie:         {ind['electrochimie_twh']:>6.1f} TWh",
-        f"  Gain efficacité:       {ind['gain_efficacite_twh']:>6.1f} TWh (-{IndustrieConfig().gain_efficacite_fraction*100:.0f}%)",
-        f"  TOTAL élec:            {ind['total_elec_twh']:>6.1f} TWh",
-        "",
-        "TERTIAIRE",
-        f"  Actuel total:          {ter['actuel_total_twh']:>6.1f} TWh",
-        f"  Chauffage (rénové+PAC):{ter['chauffage_elec_twh']:>6.1f} TWh",
-        f"  Climatisation:         {ter['climatisation_twh']:>6.1f} TWh",
-        f"  Éclairage (LED):       {ter['eclairage_twh']:>6.1f} TWh",
-        f"  Élec. spécifique:      {ter['electricite_specifique_twh']:>6.1f} TWh",
-        f"  Eau chaude:            {ter['eau_chaude_twh']:>6.1f} TWh",
-        f"  TOTAL élec:            {ter['total_elec_twh']:>6.1f} TWh",
-        "",
-        "SYNTHÈSE",
-        f"  Actuel (ind+tert):     {total['total_actuel_twh']:>6.1f} TWh",
-        f"  Électrifié:            {total['total_elec_twh']:>6.1f} TWh",
-        f"  Fossile résiduel:      {total['total_fossile_residuel_twh']:>6.1f} TWh",
-        f"  Réduction:             {total['total_actuel_twh'] - total['total_elec_twh'] - total['total_fossile_residuel_twh']:>6.1f} TWh",
-    ]
+    total = bilan_tous_secteurs(ind=ind, ter=ter)
+
+    reduction = (total['total_actuel_twh'] - total['total_elec_twh']
+                 - total['total_fossile_residuel_twh'])
+    gain_fraction = (industrie_config or _DEFAULT_IND).gain_efficacite_fraction
+    suffixes = dict(_IND_SUFFIXES, gain_efficacite_twh=f" (-{gain_fraction*100:.0f}%)")
+
+    lines = ["Secteurs Industrie et Tertiaire", "=" * 45, "", "INDUSTRIE"]
+    lines.extend(_LIGNE(label, ind[cle], suffixes.get(cle, ''))
+                 for label, cle in _IND_ROWS)
+    lines += ["", "TERTIAIRE"]
+    lines.extend(_LIGNE(label, ter[cle], '') for label, cle in _TER_ROWS)
+    lines += ["", "SYNTHÈSE"]
+    lines.extend(_LIGNE(label, total[cle], '') for label, cle in _TOTAL_ROWS)
+    lines.append(_LIGNE("Réduction:", reduction, ''))
 
     return '\n'.join(lines)
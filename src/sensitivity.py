@@ -11,14 +11,63 @@ import pandas as pd
 import numpy as np
 
 from .config import EnergyModelConfig, DEFAULT_CONFIG
-from .energy import calculer_energie_twh
+from .energy import facteur_energie_twh
+from .production import NightSlot, extract_night_data, solar_cf_to_array
+from .storage import calculate_daily_balance, daily_surplus_deficit_kwh, pack_daily_slots
+
+
+# Coarse grid step (GWc) of the zero-gas capacity search
+_ZERO_GAS_STEP = 32
+
+
+def _pack_solar_cf(
+    solar_cf: Dict[Tuple[str, str], Dict],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Daytime slot (cf, base_prod, conso, duree) columns."""
+    slots = solar_cf_to_array(solar_cf)
+    return slots['cf'], slots['base_prod'], slots['conso'], slots['duree']
+
+
+def _night_gas_twh(night: Dict[str, NightSlot], config: EnergyModelConfig) -> float:
+    """Gas need of the nighttime slots, which solar capacity does not change."""
+    deficit_kwh = sum(max(0.0, row.deficit_kw) * row.duree_h for row in night.values())
+    return deficit_kwh * facteur_energie_twh(config)
+
+
+def _day_gas_twh(
+    new_capacity_kw,
+    packed: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    config: EnergyModelConfig,
+):
+    """Gas need of the daytime slots, per total solar capacity (scalar or array)."""
+    cf, base_prod, conso, duree = packed
+    capacity_kw = np.asarray(new_capacity_kw, dtype=np.float64)[..., np.newaxis]
+    deficit = np.maximum(0.0, conso - (base_prod + cf * capacity_kw))
+    # calculer_energie_twh on every slot at once
+    return (deficit * duree).sum(axis=-1) * facteur_energie_twh(config)
+
+
+def _storage_gas_twh(new_capacity_kw, slots, config: EnergyModelConfig):
+    """Gas need with daily storage, per total solar capacity (scalar or array)."""
+    surplus, deficit = daily_surplus_deficit_kwh(new_capacity_kw, slots)
+    return _net_gas_twh(surplus, deficit, config)
+
+
+def _net_gas_twh(surplus, deficit, config: EnergyModelConfig):
+    """Gas need left once daily storage has shifted surplus onto deficit."""
+    # Storage transfers surplus to offset deficit
+    usable_surplus = surplus * config.storage.battery_efficiency
+    net_deficit_kwh = np.maximum(0.0, deficit - usable_surplus)
+    # Monthly TWh, summed over months
+    return net_deficit_kwh.sum(axis=-1) * facteur_energie_twh(config)
 
 
 def calculate_gas_need_no_storage(
     extra_solar_gwc: float,
     solar_cf: Dict[Tuple[str, str], Dict],
     df: pd.DataFrame,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> float:
     """
     Calculate gas backup need with additional solar capacity, WITHOUT storage.
@@ -28,6 +77,8 @@ def calculate_gas_need_no_storage(
         solar_cf: Capacity factor data from production.calculate_solar_capacity_factors
         df: Original DataFrame with nighttime data
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
         Total annual gas need in TWh
@@ -39,33 +90,21 @@ def calculate_gas_need_no_storage(
     new_capacity = max(0, baseline + extra_solar_gwc)
     new_capacity_kw = new_capacity * 1e6
 
-    total_gas_twh = 0.0
-
-    # Daytime slots: scale solar production
-    for (mois, plage), data in solar_cf.items():
-        new_solar = data['cf'] * new_capacity_kw
-        new_total_prod = data['base_prod'] + new_solar
-        deficit = max(0, data['conso'] - new_total_prod)
-        gas_twh = calculer_energie_twh(deficit, data['duree'], config)
-        total_gas_twh += gas_twh
-
-    # Nighttime slots: unchanged (no solar)
-    for mois in df['Mois'].unique():
-        night_data = df[(df['Mois'] == mois) & (df['Plage'] == '23h-8h')]
-        if len(night_data) > 0:
-            row = night_data.iloc[0]
-            deficit = max(0, row['Deficit_kW'])
-            gas_twh = calculer_energie_twh(deficit, row['Duree_h'], config)
-            total_gas_twh += gas_twh
+    if night is None:
+        night = extract_night_data(df)
 
-    return total_gas_twh
+    # Daytime slots: scale solar production; nighttime slots: unchanged (no solar)
+    return (float(_day_gas_twh(new_capacity_kw, _pack_solar_cf(solar_cf), config))
+            + _night_gas_twh(night, config))
 
 
 def calculate_gas_need_with_storage(
     extra_solar_gwc: float,
     solar_cf: Dict[Tuple[str, str], Dict],
     df: pd.DataFrame,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
+    balance: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> float:
     """
     Calculate gas backup need with additional solar AND daily storage.
@@ -78,6 +117,10 @@ def calculate_gas_need_with_storage(
         solar_cf: Capacity factor data
         df: Original DataFrame
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
+        balance: Daily (surplus, deficit) from storage.calculate_daily_balance
+            (computed if None)
 
     Returns:
         Total annual gas need in TWh (reduced by storage)
@@ -85,62 +128,20 @@ def calculate_gas_need_with_storage(
     if config is None:
         config = DEFAULT_CONFIG
 
-    baseline = config.production.solar_capacity_gwc
-    new_capacity = max(0, baseline + extra_solar_gwc)
-    new_capacity_kw = new_capacity * 1e6
-    efficiency = config.storage.battery_efficiency
-
-    total_gas_twh = 0.0
-
-    for mois in df['Mois'].unique():
-        # Calculate daily surplus and deficit for this month
-        daily_surplus_kwh = 0.0
-        daily_deficit_kwh = 0.0
-
-        plages = ['8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h']
-
-        for plage in plages:
-            key = (mois, plage)
-
-            if plage == '23h-8h':
-                # Nighttime: no solar, use original data
-                night_data = df[(df['Mois'] == mois) & (df['Plage'] == plage)]
-                if len(night_data) > 0:
-                    row = night_data.iloc[0]
-                    balance = row['Production_kW'] - row['Consommation_kW']
-                    duration = row['Duree_h']
-            elif key in solar_cf:
-                # Daytime: scale solar
-                data = solar_cf[key]
-                new_solar = data['cf'] * new_capacity_kw
-                new_total_prod = data['base_prod'] + new_solar
-                balance = new_total_prod - data['conso']
-                duration = data['duree']
-            else:
-                continue
-
-            if balance > 0:
-                daily_surplus_kwh += balance * duration
-            else:
-                daily_deficit_kwh += abs(balance) * duration
-
-        # Storage transfers surplus to offset deficit
-        usable_surplus = daily_surplus_kwh * efficiency
-        net_deficit_kwh = max(0, daily_deficit_kwh - usable_surplus)
-
-        # Convert to monthly TWh
-        jours = config.temporal.jours_par_mois
-        gas_twh = net_deficit_kwh * jours / 1e9
-        total_gas_twh += gas_twh
-
-    return total_gas_twh
+    if balance is None:
+        if night is None:
+            night = extract_night_data(df)
+        balance = calculate_daily_balance(extra_solar_gwc, solar_cf, night, config)
+
+    return float(_net_gas_twh(*balance, config))
 
 
 def run_sensitivity_analysis(
     df: pd.DataFrame,
     solar_cf: Dict[Tuple[str, str], Dict],
     extra_range: Optional[np.ndarray] = None,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> pd.DataFrame:
     """
     Run sensitivity analysis across a range of solar capacities.
@@ -150,6 +151,8 @@ def run_sensitivity_analysis(
         solar_cf: Capacity factor data
         extra_range: Array of extra solar values (default: -400 to +500 GWc)
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
         DataFrame with columns:
@@ -165,26 +168,25 @@ def run_sensitivity_analysis(
     if extra_range is None:
         extra_range = np.arange(-400, 501, 25)
 
-    results = []
     baseline = config.production.solar_capacity_gwc
-
-    for extra in extra_range:
-        gas_no_storage = calculate_gas_need_no_storage(
-            extra, solar_cf, df, config
-        )
-        gas_with_storage = calculate_gas_need_with_storage(
-            extra, solar_cf, df, config
-        )
-
-        results.append({
-            'extra_solar_gwc': extra,
-            'total_solar_gwc': baseline + extra,
-            'gas_no_storage_twh': gas_no_storage,
-            'gas_with_storage_twh': gas_with_storage,
-            'storage_benefit_twh': gas_no_storage - gas_with_storage,
-        })
-
-    return pd.DataFrame(results)
+    extras = np.asarray(extra_range)
+    new_capacity_kw = np.maximum(0, baseline + extras) * 1e6
+
+    # Whole sweep at once: (capacities x slots) arrays, reduced over slots
+    if night is None:
+        night = extract_night_data(df)
+    gas_no_storage = (_day_gas_twh(new_capacity_kw, _pack_solar_cf(solar_cf), config)
+                      + _night_gas_twh(night, config))
+    slots = pack_daily_slots(solar_cf, night)
+    gas_with_storage = _storage_gas_twh(new_capacity_kw, slots, config)
+
+    return pd.DataFrame({
+        'extra_solar_gwc': extras,
+        'total_solar_gwc': baseline + extras,
+        'gas_no_storage_twh': gas_no_storage,
+        'gas_with_storage_twh': gas_with_storage,
+        'storage_benefit_twh': gas_no_storage - gas_with_storage,
+    })
 
 
 def find_zero_gas_capacity(
@@ -192,12 +194,16 @@ def find_zero_gas_capacity(
     solar_cf: Dict[Tuple[str, str], Dict],
     config: Optional[EnergyModelConfig] = None,
     with_storage: bool = True,
-    tolerance_twh: float = 0.5
+    tolerance_twh: float = 0.5,
+    night: Optional[Dict[str, NightSlot]] = None,
 ) -> float:
     """
     Find the solar capacity needed to eliminate gas backup.
 
-    Uses binary search to find the capacity where gas need drops to zero.
+    Brackets the first whole GWc of extra capacity in (-400, 1000] whose
+    gas need is within tolerance with one vectorized pass every
+    _ZERO_GAS_STEP GWc, then resolves it with a second pass over the
+    bracket (gas need does not increase with capacity).
 
     Args:
         df: Original DataFrame
@@ -205,28 +211,43 @@ def find_zero_gas_capacity(
         config: Model configuration
         with_storage: Whether to include daily storage
         tolerance_twh: Acceptable residual gas (default 0.5 TWh)
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
 
     Returns:
-        Total solar capacity in GWc needed for zero gas
+        Total solar capacity in GWc needed for zero gas (baseline + 1000
+        if even that is not enough)
     """
     if config is None:
         config = DEFAULT_CONFIG
 
     baseline = config.production.solar_capacity_gwc
 
-    # Binary search
-    low, high = -400, 1000
-    calc_func = (
-        calculate_gas_need_with_storage if with_storage
-        else calculate_gas_need_no_storage
-    )
-
-    while high - low > 1:
-        mid = (low + high) // 2
-        gas = calc_func(mid, solar_cf, df, config)
-        if gas > tolerance_twh:
-            low = mid
-        else:
-            high = mid
-
-    return baseline + high
+    # Slot arrays built once for both passes
+    if night is None:
+        night = extract_night_data(df)
+    if with_storage:
+        slots = pack_daily_slots(solar_cf, night)
+
+        def gas_twh(extras):
+            return _storage_gas_twh(np.maximum(0, baseline + extras) * 1e6, slots, config)
+    else:
+        packed = _pack_solar_cf(solar_cf)
+        night_gas_twh = _night_gas_twh(night, config)
+
+        def gas_twh(extras):
+            return (_day_gas_twh(np.maximum(0, baseline + extras) * 1e6, packed, config)
+                    + night_gas_twh)
+
+    extras = np.arange(-399, 1001)
+    # Coarse pass, always including the top of the range; -gas is non-decreasing
+    coarse = np.arange(len(extras) - 1, -1, -_ZERO_GAS_STEP)[::-1]
+    k = np.searchsorted(-gas_twh(extras[coarse]), -tolerance_twh)
+    if k == len(coarse):
+        return float(baseline + extras[-1])
+
+    # Fine pass over (previous coarse point, first coarse point within tolerance]
+    lo = coarse[k - 1] + 1 if k > 0 else 0
+    hi = coarse[k]
+    idx = lo + np.searchsorted(-gas_twh(extras[lo:hi + 1]), -tolerance_twh)
+    return float(baseline + extras[idx])
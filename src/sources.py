@@ -12,7 +12,7 @@ auditability and reproducibility.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 
 
@@ -217,17 +217,24 @@ ALL_SOURCES = [
 ]
 
 
+# Lookup indexes over ALL_SOURCES, built once (first source wins on a duplicate id)
+_SOURCES_BY_ID: Dict[str, DataSource] = {}
+_SOURCES_BY_PARAM: Dict[str, List[DataSource]] = {}
+for _source in ALL_SOURCES:
+    _SOURCES_BY_ID.setdefault(_source.id, _source)
+    for _parameter in set(_source.parameters):
+        _SOURCES_BY_PARAM.setdefault(_parameter, []).append(_source)
+del _source, _parameter
+
+
 def get_source(source_id: str) -> Optional[DataSource]:
     """Get a source by its ID."""
-    for source in ALL_SOURCES:
-        if source.id == source_id:
-            return source
-    return None
+    return _SOURCES_BY_ID.get(source_id)
 
 
 def get_sources_for_parameter(parameter: str) -> List[DataSource]:
     """Get all sources that contribute to a parameter."""
-    return [s for s in ALL_SOURCES if parameter in s.parameters]
+    return list(_SOURCES_BY_PARAM.get(parameter, ()))
 
 
 def generate_bibliography() -> str:
@@ -4,32 +4,106 @@ Storage module for the Energy Transition Model.
 Calculates battery/STEP storage requirements.
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
 from .config import EnergyModelConfig, DEFAULT_CONFIG
+from .production import NightSlot, extract_night_data, solar_cf_to_array
 
 
-def calculate_storage_need(
+PLAGES = ('8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h')
+_PLAGES_JOUR = frozenset(PLAGES[:-1])
+
+
+def pack_daily_slots(
+    solar_cf: Dict[Tuple[str, str], Dict],
+    night: Dict[str, NightSlot],
+    mois_list: Optional[Sequence[str]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack the time slots of each month into arrays for the daily balance.
+
+    Args:
+        solar_cf: Capacity factor data (daytime slots)
+        night: Nighttime slots from production.extract_night_data
+        mois_list: Months to include, in output order (default: every month
+            with a night or daytime slot, in first-seen order)
+
+    Returns:
+        (cf, base_prod, conso, duree, one_hot): per-slot float arrays, the
+        night slot having cf 0 and its measured production as base_prod,
+        plus a (slots, months) matrix mapping each slot to its month
+    """
+    if mois_list is None:
+        mois_list = list(dict.fromkeys([*night, *(mois for mois, _ in solar_cf)]))
+    position = {mois: i for i, mois in enumerate(mois_list)}
+
+    # Daytime slots of the listed months, then the night slot of each month
+    day = solar_cf_to_array(solar_cf)
+    day_month = np.fromiter(
+        (position.get(mois, -1) if plage in _PLAGES_JOUR else -1
+         for mois, plage in solar_cf),
+        dtype=np.intp, count=len(day))
+    keep = day_month >= 0
+    day, day_month = day[keep], day_month[keep]
+    nights = [(position[mois], night[mois]) for mois in mois_list if mois in night]
+
+    month_of_slot = np.concatenate([day_month, [i for i, _ in nights]]).astype(np.intp)
+    cf = np.concatenate([day['cf'], np.zeros(len(nights))])
+    base_prod = np.concatenate([day['base_prod'], [n.production_kw for _, n in nights]])
+    conso = np.concatenate([day['conso'], [n.consommation_kw for _, n in nights]])
+    duree = np.concatenate([day['duree'], [n.duree_h for _, n in nights]])
+
+    one_hot = np.zeros((len(month_of_slot), len(mois_list)))
+    one_hot[np.arange(len(month_of_slot)), month_of_slot] = 1.0
+    return cf, base_prod, conso, duree, one_hot
+
+
+def daily_surplus_deficit_kwh(
+    new_capacity_kw,
+    slots: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Daily surplus and deficit energy of each month for a total solar capacity.
+
+    Args:
+        new_capacity_kw: Total solar capacity in kW (scalar, or array for a sweep)
+        slots: Slot arrays from pack_daily_slots
+
+    Returns:
+        (surplus_kwh, deficit_kwh), each of shape capacity shape + (months,)
+    """
+    cf, base_prod, conso, duree, one_hot = slots
+    capacity_kw = np.asarray(new_capacity_kw, dtype=np.float64)[..., np.newaxis]
+    energy = (base_prod + cf * capacity_kw - conso) * duree
+    surplus = np.maximum(energy, 0.0)
+    # max(-energy, 0) exactly: 0 where energy >= 0, -energy elsewhere
+    deficit = surplus - energy
+    return surplus @ one_hot, deficit @ one_hot
+
+
+def calculate_daily_balance(
     extra_solar_gwc: float,
     solar_cf: Dict[Tuple[str, str], Dict],
-    df: pd.DataFrame,
-    config: Optional[EnergyModelConfig] = None
-) -> float:
+    night: Dict[str, NightSlot],
+    config: Optional[EnergyModelConfig] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculate the daily storage capacity needed for a given solar level.
+    Calculate the daily surplus and deficit of each month for a solar level.
 
-    Storage requirement is the minimum of daily surplus and deficit,
-    representing how much energy needs to be shifted within each day.
+    Shared by the storage requirement and the gas need with storage, so a
+    caller needing both computes the balance once and passes it to each.
 
     Args:
         extra_solar_gwc: Additional solar capacity beyond baseline
         solar_cf: Capacity factor data
-        df: Original DataFrame
+        night: Nighttime slots from production.extract_night_data
         config: Model configuration
 
     Returns:
-        Maximum required storage capacity in GWh (across all months)
+        (surplus_kwh, deficit_kwh): daily energy per month, in
+        config.temporal.mois_ordre order
     """
     if config is None:
         config = DEFAULT_CONFIG
@@ -38,51 +112,54 @@ def calculate_storage_need(
     new_capacity = max(0, baseline + extra_solar_gwc)
     new_capacity_kw = new_capacity * 1e6
 
-    max_storage_needed = 0.0
-
-    for mois in config.temporal.mois_ordre_hiver:
-        daily_surplus_gwh = 0.0
-        daily_deficit_gwh = 0.0
+    slots = pack_daily_slots(solar_cf, night, config.temporal.mois_ordre)
+    return daily_surplus_deficit_kwh(new_capacity_kw, slots)
 
-        plages = ['8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h']
 
-        for plage in plages:
-            key = (mois, plage)
+def calculate_storage_need(
+    extra_solar_gwc: float,
+    solar_cf: Dict[Tuple[str, str], Dict],
+    df: pd.DataFrame,
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
+    balance: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> float:
+    """
+    Calculate the daily storage capacity needed for a given solar level.
 
-            if plage == '23h-8h':
-                night_data = df[(df['Mois'] == mois) & (df['Plage'] == plage)]
-                if len(night_data) > 0:
-                    row = night_data.iloc[0]
-                    balance_gw = (row['Production_kW'] - row['Consommation_kW']) / 1e6
-                    duration = row['Duree_h']
-                else:
-                    continue
-            elif key in solar_cf:
-                data = solar_cf[key]
-                new_solar = data['cf'] * new_capacity_kw
-                new_prod = data['base_prod'] + new_solar
-                balance_gw = (new_prod - data['conso']) / 1e6
-                duration = data['duree']
-            else:
-                continue
+    Storage requirement is the minimum of daily surplus and deficit,
+    representing how much energy needs to be shifted within each day.
 
-            if balance_gw > 0:
-                daily_surplus_gwh += balance_gw * duration
-            else:
-                daily_deficit_gwh += abs(balance_gw) * duration
+    Args:
+        extra_solar_gwc: Additional solar capacity beyond baseline
+        solar_cf: Capacity factor data
+        df: Original DataFrame
+        config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
+        balance: Daily (surplus, deficit) from calculate_daily_balance
+            (computed if None)
 
-        # Storage needed is min(surplus, deficit) for each day
-        storage_needed = min(daily_surplus_gwh, daily_deficit_gwh)
-        max_storage_needed = max(max_storage_needed, storage_needed)
+    Returns:
+        Maximum required storage capacity in GWh (across all months)
+    """
+    if balance is None:
+        if night is None:
+            night = extract_night_data(df)
+        balance = calculate_daily_balance(extra_solar_gwc, solar_cf, night, config)
 
-    return max_storage_needed
+    # Storage needed is min(surplus, deficit) for each day
+    storage_needed_gwh = np.minimum(*balance) / 1e6
+    return float(storage_needed_gwh.max(initial=0.0))
 
 
 def calculate_storage_by_month(
     extra_solar_gwc: float,
     solar_cf: Dict[Tuple[str, str], Dict],
     df: pd.DataFrame,
-    config: Optional[EnergyModelConfig] = None
+    config: Optional[EnergyModelConfig] = None,
+    night: Optional[Dict[str, NightSlot]] = None,
+    balance: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> Dict[str, float]:
     """
     Calculate storage needs for each month.
@@ -92,6 +169,10 @@ def calculate_storage_by_month(
         solar_cf: Capacity factor data
         df: Original DataFrame
         config: Model configuration
+        night: Nighttime slots from production.extract_night_data
+            (extracted from df if None)
+        balance: Daily (surplus, deficit) from calculate_daily_balance
+            (computed if None)
 
     Returns:
         Dict mapping month names to storage requirement in GWh
@@ -99,46 +180,13 @@ def calculate_storage_by_month(
     if config is None:
         config = DEFAULT_CONFIG
 
-    baseline = config.production.solar_capacity_gwc
-    new_capacity = max(0, baseline + extra_solar_gwc)
-    new_capacity_kw = new_capacity * 1e6
+    if balance is None:
+        if night is None:
+            night = extract_night_data(df)
+        balance = calculate_daily_balance(extra_solar_gwc, solar_cf, night, config)
 
-    storage_by_month = {}
-
-    for mois in config.temporal.mois_ordre:
-        daily_surplus_gwh = 0.0
-        daily_deficit_gwh = 0.0
-
-        plages = ['8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h']
-
-        for plage in plages:
-            key = (mois, plage)
-
-            if plage == '23h-8h':
-                night_data = df[(df['Mois'] == mois) & (df['Plage'] == plage)]
-                if len(night_data) > 0:
-                    row = night_data.iloc[0]
-                    balance_gw = (row['Production_kW'] - row['Consommation_kW']) / 1e6
-                    duration = row['Duree_h']
-                else:
-                    continue
-            elif key in solar_cf:
-                data = solar_cf[key]
-                new_solar = data['cf'] * new_capacity_kw
-                new_prod = data['base_prod'] + new_solar
-                balance_gw = (new_prod - data['conso']) / 1e6
-                duration = data['duree']
-            else:
-                continue
-
-            if balance_gw > 0:
-                daily_surplus_gwh += balance_gw * duration
-            else:
-                daily_deficit_gwh += abs(balance_gw) * duration
-
-        storage_by_month[mois] = min(daily_surplus_gwh, daily_deficit_gwh)
-
-    return storage_by_month
+    storage_gwh = np.minimum(*balance) / 1e6
+    return dict(zip(config.temporal.mois_ordre, storage_gwh.tolist()))
 
 
 def storage_equivalents(storage_gwh: float) -> Dict[str, float]:
@@ -17,15 +17,22 @@ Sources:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+import numpy as np
 
+from .balayage import champs_balayage
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TarificationConfig:
     """
     Steady-state pricing parameters.
 
     All costs are annualized in the target scenario (2050, 500 GWc solar).
+    Frozen so that it can key the cost caches; use dataclasses.replace
+    to derive variants.
     """
 
     # --- Production costs (annualized) ---
@@ -101,7 +108,11 @@ class TarificationConfig:
     part_tertiaire: float = 0.25  # 25% tertiary
 
 
-def cout_production_annuel(config: Optional[TarificationConfig] = None) -> Dict[str, float]:
+_DEFAULT = TarificationConfig()
+
+
+@lru_cache(maxsize=32)
+def cout_production_annuel(config: Optional[TarificationConfig] = None) -> Mapping[str, float]:
     """
     Calculate annual production costs by source.
 
@@ -109,11 +120,16 @@ def cout_production_annuel(config: Optional[TarificationConfig] = None) -> Dict[
         config: Pricing configuration
 
     Returns:
-        Dict with production costs in €B
+        Production costs in €B (read-only, cached per config)
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
+
+    return MappingProxyType(_calcul_cout_production(config))
 
+
+def _calcul_cout_production(config: TarificationConfig) -> Dict[str, float]:
+    """Production costs of a config (or of a SimpleNamespace of its fields)."""
     solaire = config.solaire_twh * config.solaire_lcoe_eur_mwh / 1000
     nucleaire = config.nucleaire_twh * config.nucleaire_lcoe_eur_mwh / 1000
     hydro = config.hydro_twh * config.hydro_lcoe_eur_mwh / 1000
@@ -132,7 +148,8 @@ def cout_production_annuel(config: Optional[TarificationConfig] = None) -> Dict[
     }
 
 
-def cout_systeme_annuel(config: Optional[TarificationConfig] = None) -> Dict[str, float]:
+@lru_cache(maxsize=32)
+def cout_systeme_annuel(config: Optional[TarificationConfig] = None) -> Mapping[str, float]:
     """
     Calculate annual system costs (grid, services).
 
@@ -140,11 +157,16 @@ def cout_systeme_annuel(config: Optional[TarificationConfig] = None) -> Dict[str
         config: Pricing configuration
 
     Returns:
-        Dict with system costs in €B
+        System costs in €B (read-only, cached per config)
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
+
+    return MappingProxyType(_calcul_cout_systeme(config))
+
 
+def _calcul_cout_systeme(config: TarificationConfig) -> Dict[str, float]:
+    """System costs of a config (or of a SimpleNamespace of its fields)."""
     reseau = config.reseau_cout_annuel_eur_b + config.reseau_investissement_annuel_eur_b
     services = config.services_systeme_eur_b
     soutien = config.soutien_enr_eur_b
@@ -157,7 +179,8 @@ def cout_systeme_annuel(config: Optional[TarificationConfig] = None) -> Dict[str
     }
 
 
-def tarif_equilibre_eur_mwh(config: Optional[TarificationConfig] = None) -> Dict[str, float]:
+@lru_cache(maxsize=32)
+def tarif_equilibre_eur_mwh(config: Optional[TarificationConfig] = None) -> Mapping[str, float]:
     """
     Calculate the break-even electricity tariff.
 
@@ -167,23 +190,32 @@ def tarif_equilibre_eur_mwh(config: Optional[TarificationConfig] = None) -> Dict
         config: Pricing configuration
 
     Returns:
-        Dict with tariff components in €/MWh
+        Tariff components in €/MWh (read-only, cached per config)
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
 
-    prod = cout_production_annuel(config)
-    sys = cout_systeme_annuel(config)
-    conso_twh = config.consommation_totale_twh
+    return MappingProxyType(_tarif_depuis_couts(
+        cout_production_annuel(config), cout_systeme_annuel(config), config))
+
+
+def _tarif_depuis_couts(
+    prod: Mapping[str, float],
+    sys: Mapping[str, float],
+    config: TarificationConfig,
+) -> Dict[str, float]:
+    """Break-even tariff components from precomputed production/system costs."""
+    # €B -> €/MWh over the annual consumption, one division for all components
+    eur_b_vers_eur_mwh = 1000 / config.consommation_totale_twh
 
     # Production component (€/MWh)
-    composante_production = prod['total_production_eur_b'] * 1000 / conso_twh
+    composante_production = prod['total_production_eur_b'] * eur_b_vers_eur_mwh
 
     # Grid component
-    composante_reseau = sys['reseau_eur_b'] * 1000 / conso_twh
+    composante_reseau = sys['reseau_eur_b'] * eur_b_vers_eur_mwh
 
     # Services and support
-    composante_services = (sys['services_systeme_eur_b'] + sys['soutien_enr_eur_b']) * 1000 / conso_twh
+    composante_services = (sys['services_systeme_eur_b'] + sys['soutien_enr_eur_b']) * eur_b_vers_eur_mwh
 
     # Taxes
     composante_taxes = config.taxes_eur_mwh
@@ -201,7 +233,34 @@ def tarif_equilibre_eur_mwh(config: Optional[TarificationConfig] = None) -> Dict
     }
 
 
-def flux_financiers(config: Optional[TarificationConfig] = None) -> Dict[str, float]:
+def tarif_equilibre_sweep(
+    config: Optional[TarificationConfig] = None,
+    **valeurs,
+) -> Dict[str, np.ndarray]:
+    """
+    Break-even tariff over arrays of parameter values, without configs.
+
+    Runs the tarif_equilibre_eur_mwh arithmetic once on broadcast arrays,
+    for batch scenario runs (e.g. Monte Carlo draws of costs and volumes).
+
+    Args:
+        config: Pricing configuration supplying the fields not swept
+        **valeurs: TarificationConfig field name -> array of values
+
+    Returns:
+        Same keys as tarif_equilibre_eur_mwh, each a broadcast array (or a
+        float for components that do not depend on the swept fields)
+    """
+    if config is None:
+        config = _DEFAULT
+
+    variantes = champs_balayage(config, valeurs)
+    return _tarif_depuis_couts(
+        _calcul_cout_production(variantes), _calcul_cout_systeme(variantes), variantes)
+
+
+@lru_cache(maxsize=32)
+def flux_financiers(config: Optional[TarificationConfig] = None) -> Mapping[str, float]:
     """
     Calculate annual financial flows between actors.
 
@@ -215,14 +274,23 @@ def flux_financiers(config: Optional[TarificationConfig] = None) -> Dict[str, fl
         config: Pricing configuration
 
     Returns:
-        Dict with annual flows in €B
+        Annual flows in €B (read-only, cached per config)
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
 
-    tarif = tarif_equilibre_eur_mwh(config)
-    prod = cout_production_annuel(config)
-    sys = cout_systeme_annuel(config)
+    return MappingProxyType(_flux_depuis(
+        cout_production_annuel(config), cout_systeme_annuel(config),
+        tarif_equilibre_eur_mwh(config), config))
+
+
+def _flux_depuis(
+    prod: Mapping[str, float],
+    sys: Mapping[str, float],
+    tarif: Mapping[str, float],
+    config: TarificationConfig,
+) -> Dict[str, float]:
+    """Financial flows from precomputed costs and tariff."""
     conso = config.consommation_totale_twh
 
     # Consumer payments (total revenue)
@@ -268,10 +336,16 @@ def comparaison_cout_consommateur(config: Optional[TarificationConfig] = None) -
         Dict with cost comparison
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
 
-    tarif = tarif_equilibre_eur_mwh(config)
+    return _comparaison_depuis(tarif_equilibre_eur_mwh(config), config)
 
+
+def _comparaison_depuis(
+    tarif: Mapping[str, float],
+    config: TarificationConfig,
+) -> Dict[str, float]:
+    """Consumer cost comparison from a precomputed tariff."""
     # Current annual electricity bill (households)
     # Average French household: ~4.7 MWh/year
     conso_menage_mwh = 4.7
@@ -336,10 +410,16 @@ def analyse_sensibilite_tarif(
         Dict mapping parameter names to their impact on tariff
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
+
+    return _sensibilite_depuis(tarif_equilibre_eur_mwh(config)['total_ttc_eur_mwh'], config)
 
-    base_tarif = tarif_equilibre_eur_mwh(config)['total_ttc_eur_mwh']
 
+def _sensibilite_depuis(
+    base_tarif: float,
+    config: TarificationConfig,
+) -> Dict[str, Dict[str, float]]:
+    """Tariff sensitivity from the base config's precomputed tariff."""
     sensibilites = {}
 
     # Test each parameter
@@ -351,16 +431,17 @@ def analyse_sensibilite_tarif(
         ('gaz_volume', 'gaz_twh', config.gaz_twh),
     ]
 
-    for name, attr, base_val in params:
-        # +20%
-        config_high = TarificationConfig()
-        setattr(config_high, attr, base_val * 1.2)
-        tarif_high = tarif_equilibre_eur_mwh(config_high)['total_ttc_eur_mwh']
+    # All variants in one sweep: each swept field is a vector over the
+    # (+20%, -20%) pairs of every parameter, equal to its base value
+    # outside its own pair
+    valeurs = {}
+    for i, (_, attr, base_val) in enumerate(params):
+        valeurs[attr] = np.full(2 * len(params), base_val, dtype=np.float64)
+        valeurs[attr][2 * i:2 * i + 2] = (base_val * 1.2, base_val * 0.8)
+    tarifs = tarif_equilibre_sweep(config, **valeurs)['total_ttc_eur_mwh'].tolist()
 
-        # -20%
-        config_low = TarificationConfig()
-        setattr(config_low, attr, base_val * 0.8)
-        tarif_low = tarif_equilibre_eur_mwh(config_low)['total_ttc_eur_mwh']
+    for i, (name, _, _) in enumerate(params):
+        tarif_high, tarif_low = tarifs[2 * i], tarifs[2 * i + 1]
 
         sensibilites[name] = {
             'base_eur_mwh': base_tarif,
@@ -373,25 +454,66 @@ def analyse_sensibilite_tarif(
     return sensibilites
 
 
-def resume_tarification(config: Optional[TarificationConfig] = None) -> str:
+@dataclass(frozen=True, slots=True)
+class TarificationResultats:
+    """Every output of the pricing model for one config (see calcul_tarification)."""
+
+    prod: Mapping[str, float]
+    sys: Mapping[str, float]
+    tarif: Mapping[str, float]
+    flux: Mapping[str, float]
+    comp: Dict[str, float]
+    sensib: Dict[str, Dict[str, float]]
+
+
+def calcul_tarification(config: Optional[TarificationConfig] = None) -> TarificationResultats:
     """
-    Generate human-readable pricing model summary.
+    Evaluate the whole pricing model once.
+
+    Production and system costs and the tariff are computed first, then
+    passed down to the flows, consumer comparison and sensitivity instead
+    of each of them recomputing (or looking up) its inputs.
 
     Args:
         config: Pricing configuration
 
     Returns:
-        Formatted summary string
+        TarificationResultats with the outputs of cout_production_annuel,
+        cout_systeme_annuel, tarif_equilibre_eur_mwh, flux_financiers,
+        comparaison_cout_consommateur and analyse_sensibilite_tarif
     """
     if config is None:
-        config = TarificationConfig()
+        config = _DEFAULT
 
     prod = cout_production_annuel(config)
     sys = cout_systeme_annuel(config)
     tarif = tarif_equilibre_eur_mwh(config)
-    flux = flux_financiers(config)
-    comp = comparaison_cout_consommateur(config)
-    sensib = analyse_sensibilite_tarif(config)
+    return TarificationResultats(
+        prod=prod,
+        sys=sys,
+        tarif=tarif,
+        flux=MappingProxyType(_flux_depuis(prod, sys, tarif, config)),
+        comp=_comparaison_depuis(tarif, config),
+        sensib=_sensibilite_depuis(tarif['total_ttc_eur_mwh'], config),
+    )
+
+
+def resume_tarification(config: Optional[TarificationConfig] = None) -> str:
+    """
+    Generate human-readable pricing model summary.
+
+    Args:
+        config: Pricing configuration
+
+    Returns:
+        Formatted summary string
+    """
+    if config is None:
+        config = _DEFAULT
+
+    res = calcul_tarification(config)
+    prod, sys, tarif = res.prod, res.sys, res.tarif
+    flux, comp, sensib = res.flux, res.comp, res.sensib
 
     lines = [
         "Modele de Tarification en Regime Permanent",
@@ -4,7 +4,12 @@ Temporal utilities for the Energy Transition Model.
 Functions for parsing time periods and calculating solar availability.
 """
 
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+
 from .config import EnergyModelConfig, DEFAULT_CONFIG
 
 
@@ -27,7 +32,31 @@ MOIS_MAP = {
     'décembre': 'Décembre',
 }
 
+# Any key of MOIS_MAP, found in a single pass over the lowercased period
+_MOIS_RE = re.compile('|'.join(map(re.escape, MOIS_MAP)))
+
+
+@lru_cache(maxsize=4096)
+def parse_periode(periode: str) -> Tuple[str, str]:
+    """
+    Extract both the month and the time slot from a period string.
+
+    Lowercases the string once for both lookups; prefer it over calling
+    extraire_mois and extraire_plage on the same period. Results are
+    cached per period string, like those of the two single-purpose
+    functions, so repeated loads of the same labels skip the parsing.
+
+    Args:
+        periode: Period string like "Janvier 8 heures - 13 heures"
+
+    Returns:
+        (mois, plage), as returned by extraire_mois and extraire_plage
+    """
+    periode_lower = periode.lower()
+    return _mois_depuis(periode_lower), _plage_depuis(periode_lower)
 
+
+@lru_cache(maxsize=4096)
 def extraire_mois(periode: str) -> str:
     """
     Extract the month name from a period string.
@@ -36,15 +65,13 @@ def extraire_mois(periode: str) -> str:
         periode: Period string like "Janvier 8 heures - 13 heures"
 
     Returns:
-        Normalized month name (e.g., "Janvier") or "Inconnu"
+        Normalized month name (e.g., "Janvier") or "Inconnu"; if several
+        month names appear, the first one in the string wins
     """
-    periode_lower = periode.lower()
-    for key, val in MOIS_MAP.items():
-        if key in periode_lower:
-            return val
-    return 'Inconnu'
+    return _mois_depuis(periode.lower())
 
 
+@lru_cache(maxsize=4096)
 def extraire_plage(periode: str) -> str:
     """
     Extract the time slot from a period string.
@@ -55,8 +82,17 @@ def extraire_plage(periode: str) -> str:
     Returns:
         Time slot identifier (e.g., "8h-13h") or "Autre"
     """
-    periode_lower = periode.lower()
+    return _plage_depuis(periode.lower())
+
+
+def _mois_depuis(periode_lower: str) -> str:
+    """Month name of an already lowercased period string."""
+    match = _MOIS_RE.search(periode_lower)
+    return MOIS_MAP[match.group(0)] if match else 'Inconnu'
+
 
+def _plage_depuis(periode_lower: str) -> str:
+    """Time slot of an already lowercased period string."""
     # Note: '18 heures' contains '8 heure', so check for absence of '18'
     if '8 heure' in periode_lower and '13' in periode_lower and '18' not in periode_lower:
         return '8h-13h'
@@ -153,6 +189,88 @@ def fraction_solaire_attendue(
     return 0.5  # Unknown - assume partial
 
 
+# Integer code of each time slot, for the array version below
+PLAGE_CODES = {'8h-13h': 0, '13h-18h': 1, '18h-20h': 2, '20h-23h': 3, '23h-8h': 4}
+
+
+def fraction_solaire_vectorisee(sunset: np.ndarray, plage_codes: np.ndarray) -> np.ndarray:
+    """
+    Array version of fraction_solaire_attendue.
+
+    Args:
+        sunset: Sunset hour of each element's month (18.0 for unknown months)
+        plage_codes: PLAGE_CODES value of each element's time slot (-1 for
+            an unknown slot); broadcast against sunset
+
+    Returns:
+        Fraction between 0.0 and 1.0, same values as the scalar function
+    """
+    sunset = np.asarray(sunset, dtype=np.float64)
+    plage_codes = np.asarray(plage_codes)
+    return np.select(
+        [(plage_codes == 0) | (plage_codes == 1), plage_codes == 2,
+         plage_codes == 3, plage_codes == 4],
+        [1.0, np.clip((sunset - 18) / 2, 0.0, 1.0),
+         np.clip((sunset - 20) / 3, 0.0, 1.0), 0.0],
+        default=0.5,
+    )
+
+
+def est_plage_nocturne_vectorisee(sunset: np.ndarray, plage_codes: np.ndarray) -> np.ndarray:
+    """
+    Array version of est_plage_nocturne.
+
+    Args:
+        sunset: Sunset hour of each element's month (18.0 for unknown months)
+        plage_codes: PLAGE_CODES value of each element's time slot (-1 for
+            an unknown slot); broadcast against sunset
+
+    Returns:
+        Boolean array, True where the time slot has no sunlight
+    """
+    sunset = np.asarray(sunset, dtype=np.float64)
+    plage_codes = np.asarray(plage_codes)
+    return ((plage_codes == 4)
+            | ((plage_codes == 3) & (sunset < 20))
+            | ((plage_codes == 2) & (sunset < 18)))
+
+
+def fraction_solaire_df(
+    df: pd.DataFrame,
+    mois_col: str = 'Mois',
+    plage_col: str = 'Plage',
+    config: Optional[EnergyModelConfig] = None,
+) -> np.ndarray:
+    """
+    fraction_solaire_attendue of every row of a DataFrame.
+
+    Evaluates each distinct (month, slot) category pair once with
+    fraction_solaire_vectorisee and gathers the rows by their integer
+    category codes; use it instead of a per-row apply for bulk work.
+
+    Args:
+        df: DataFrame with month and time slot columns (plain or categorical)
+        mois_col: Name of the month column
+        plage_col: Name of the time slot column
+        config: Model configuration (uses DEFAULT_CONFIG if None)
+
+    Returns:
+        Float array with one sunlight fraction per row
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    mois_cat = df[mois_col].astype('category').cat
+    plage_cat = df[plage_col].astype('category').cat
+    sunset_times = config.temporal.sunset_times
+    sunset = np.array([sunset_times.get(mois, 18.0) for mois in mois_cat.categories],
+                      dtype=np.float64)
+    codes = np.array([PLAGE_CODES.get(plage, -1) for plage in plage_cat.categories],
+                     dtype=np.intp)
+    frac_grid = fraction_solaire_vectorisee(sunset[:, np.newaxis], codes)
+    return frac_grid[mois_cat.codes, plage_cat.codes]
+
+
 def get_plage_duration(plage: str, config: Optional[EnergyModelConfig] = None) -> float:
     """
     Get the duration of a time slot in hours.
@@ -15,11 +15,16 @@ Sources:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 import math
 
+import numpy as np
 
-@dataclass
+from .balayage import champs_balayage
+
+
+@dataclass(frozen=True, slots=True)
 class TrajectoryConfig:
     """Configuration for the deployment trajectory."""
 
@@ -90,12 +95,39 @@ class TrajectoryConfig:
     gaz_a: float = -0.253  # TWh per GWc
     gaz_b: float = 240.5   # TWh intercept
 
+    # --- Derived constants (year-independent, set in __post_init__) ---
+    # S-curve values at annee_debut and annee_fin
+    _solaire_s_bornes: Tuple[float, float] = field(init=False, repr=False, compare=False)
+    _pac_s_bornes: Tuple[float, float] = field(init=False, repr=False, compare=False)
+    # Learning-curve exponents log2(1 - learning_rate)
+    _solaire_exposant: float = field(init=False, repr=False, compare=False)
+    _batterie_exposant: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the constants every per-year evaluation shares."""
+        object.__setattr__(self, '_solaire_s_bornes', (
+            logistic(self.annee_debut, self.solaire_midpoint, self.solaire_steepness),
+            logistic(self.annee_fin, self.solaire_midpoint, self.solaire_steepness),
+        ))
+        object.__setattr__(self, '_pac_s_bornes', (
+            logistic(self.annee_debut, self.pac_midpoint, self.pac_steepness),
+            logistic(self.annee_fin, self.pac_midpoint, self.pac_steepness),
+        ))
+        object.__setattr__(self, '_solaire_exposant', math.log2(1 - self.solaire_learning_rate))
+        object.__setattr__(self, '_batterie_exposant', math.log2(1 - self.batterie_learning_rate))
+
+
+# Below this x, exp(-x) overflows a float and logistic switches to exp(x) / (1 + exp(x))
+_X_MIN = -709.0
+
 
 def logistic(year: int, midpoint: int, steepness: float) -> float:
     """
     Logistic (S-curve) function for deployment modeling.
 
-    Returns a value between 0 and 1.
+    Returns a value between 0 and 1. Far before the midpoint, where
+    exp(-x) would overflow, it uses the equivalent exp(x) / (1 + exp(x)),
+    so distant years keep distinct nonzero values.
 
     Args:
         year: Current year
@@ -105,7 +137,14 @@ def logistic(year: int, midpoint: int, steepness: float) -> float:
     Returns:
         Fraction of deployment completed (0 to 1)
     """
-    return 1.0 / (1.0 + math.exp(-steepness * (year - midpoint)))
+    x = steepness * (year - midpoint)
+    if x < _X_MIN:
+        e = math.exp(x)
+        return e / (1.0 + e)
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+_DEFAULT = TrajectoryConfig()
 
 
 def capacite_solaire_gwc(year: int, config: Optional[TrajectoryConfig] = None) -> float:
@@ -122,7 +161,7 @@ def capacite_solaire_gwc(year: int, config: Optional[TrajectoryConfig] = None) -
         Installed solar capacity in GWc
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
     if year <= config.annee_debut:
         return config.solaire_actuel_gwc
@@ -130,8 +169,7 @@ def capacite_solaire_gwc(year: int, config: Optional[TrajectoryConfig] = None) -
         return config.solaire_cible_gwc
 
     # Normalize logistic to map from actual to target
-    s_start = logistic(config.annee_debut, config.solaire_midpoint, config.solaire_steepness)
-    s_end = logistic(config.annee_fin, config.solaire_midpoint, config.solaire_steepness)
+    s_start, s_end = config._solaire_s_bornes
     s_now = logistic(year, config.solaire_midpoint, config.solaire_steepness)
 
     fraction = (s_now - s_start) / (s_end - s_start)
@@ -150,15 +188,14 @@ def penetration_pac(year: int, config: Optional[TrajectoryConfig] = None) -> flo
         Fraction of eligible homes with heat pumps (0 to 1)
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
     if year <= config.annee_debut:
         return config.pac_actuel_fraction
     if year >= config.annee_fin:
         return config.pac_cible_fraction
 
-    s_start = logistic(config.annee_debut, config.pac_midpoint, config.pac_steepness)
-    s_end = logistic(config.annee_fin, config.pac_midpoint, config.pac_steepness)
+    s_start, s_end = config._pac_s_bornes
     s_now = logistic(year, config.pac_midpoint, config.pac_steepness)
 
     fraction = (s_now - s_start) / (s_end - s_start)
@@ -180,7 +217,7 @@ def cout_solaire_eur_kw(year: int, config: Optional[TrajectoryConfig] = None) ->
         Solar cost in €/kW
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
     # Cumulative French additions (rough proxy: half deployed by midpoint)
     additions_gwc = capacite_solaire_gwc(year, config) - config.solaire_actuel_gwc
@@ -189,9 +226,8 @@ def cout_solaire_eur_kw(year: int, config: Optional[TrajectoryConfig] = None) ->
     global_cumul = config.solaire_cumul_mondial_gwc + additions_gwc / 0.05
 
     # Learning curve: cost = initial × (cumul/initial_cumul)^log2(1-learning_rate)
-    exponent = math.log2(1 - config.solaire_learning_rate)
     ratio = global_cumul / config.solaire_cumul_mondial_gwc
-    return config.solaire_cout_actuel_eur_kw * (ratio ** exponent)
+    return config.solaire_cout_actuel_eur_kw * (ratio ** config._solaire_exposant)
 
 
 def cout_batterie_eur_kwh(year: int, config: Optional[TrajectoryConfig] = None) -> float:
@@ -206,15 +242,14 @@ def cout_batterie_eur_kwh(year: int, config: Optional[TrajectoryConfig] = None)
         Battery cost in €/kWh
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
     # Global battery deployment grows ~25% per year
     years_elapsed = max(0, year - config.annee_debut)
     global_cumul = config.batterie_cumul_mondial_gwh * (1.25 ** years_elapsed)
 
-    exponent = math.log2(1 - config.batterie_learning_rate)
     ratio = global_cumul / config.batterie_cumul_mondial_gwh
-    return config.batterie_cout_actuel_eur_kwh * (ratio ** exponent)
+    return config.batterie_cout_actuel_eur_kwh * (ratio ** config._batterie_exposant)
 
 
 def gaz_backup_twh(solar_gwc: float, config: Optional[TrajectoryConfig] = None) -> float:
@@ -231,17 +266,129 @@ def gaz_backup_twh(solar_gwc: float, config: Optional[TrajectoryConfig] = None)
         Annual gas backup in TWh
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
     return max(0.0, config.gaz_a * solar_gwc + config.gaz_b)
 
 
+def _logistique(x):
+    """Vectorized logistic of x = steepness × (year - midpoint), computed like logistic."""
+    # Clamp each form's exponent to where it is used, so neither overflows
+    e = np.exp(np.minimum(x, _X_MIN))
+    return np.where(x < _X_MIN, e / (1.0 + e),
+                    1.0 / (1.0 + np.exp(-np.maximum(x, _X_MIN))))
+
+
+def _deploiement(
+    years: np.ndarray,
+    actuel,
+    cible,
+    midpoint,
+    steepness,
+    s_bornes: Tuple,
+    config: TrajectoryConfig,
+) -> np.ndarray:
+    """Normalized S-curve between current and target values, over an array of years."""
+    s_start, s_end = s_bornes
+    s_now = _logistique(steepness * (years - midpoint))
+
+    fraction = (s_now - s_start) / (s_end - s_start)
+    valeurs = actuel + fraction * (cible - actuel)
+    valeurs = np.where(years >= config.annee_fin, cible, valeurs)
+    return np.where(years <= config.annee_debut, actuel, valeurs)
+
+
+def _courbes_trajectoire(years: np.ndarray, config) -> Dict[str, np.ndarray]:
+    """
+    Unrounded trajectory metrics over an array of years.
+
+    config is a TrajectoryConfig, or a namespace from _champs_balayage whose
+    swept fields are arrays broadcasting against years.
+    """
+    # Reference: current gas use for sectors being electrified
+    # Transport: ~50 Mtep fossil → ~580 TWh; Buildings: ~40 Mtep → ~465 TWh
+    facteur_gaz_tco2_mwh = 0.227  # tCO2/MWh from emissions module
+
+    solar = _deploiement(years, config.solaire_actuel_gwc, config.solaire_cible_gwc,
+                         config.solaire_midpoint, config.solaire_steepness,
+                         config._solaire_s_bornes, config)
+    pac = _deploiement(years, config.pac_actuel_fraction, config.pac_cible_fraction,
+                       config.pac_midpoint, config.pac_steepness,
+                       config._pac_s_bornes, config)
+
+    # Learning curves (see cout_solaire_eur_kw and cout_batterie_eur_kwh)
+    global_cumul_sol = config.solaire_cumul_mondial_gwc + (solar - config.solaire_actuel_gwc) / 0.05
+    cout_sol = config.solaire_cout_actuel_eur_kw * (
+        (global_cumul_sol / config.solaire_cumul_mondial_gwc)
+        ** config._solaire_exposant)
+    global_cumul_bat = config.batterie_cumul_mondial_gwh * (
+        1.25 ** np.maximum(0, years - config.annee_debut))
+    cout_bat = config.batterie_cout_actuel_eur_kwh * (
+        (global_cumul_bat / config.batterie_cumul_mondial_gwh)
+        ** config._batterie_exposant)
+    gaz = np.maximum(0.0, config.gaz_a * solar + config.gaz_b)
+
+    # Annual solar additions
+    solar_ajout = np.diff(solar, prepend=np.broadcast_to(
+        config.solaire_actuel_gwc, solar.shape[:-1] + (1,)))
+
+    # Annual investment: solar additions × cost
+    invest_solaire = solar_ajout * cout_sol / 1000  # €B (GWc × €/kW = €M, /1000 = €B)
+
+    # Annual gas cost
+    cout_gaz_annuel = gaz * config.gaz_cout_eur_mwh / 1000  # €B
+
+    # Emissions from gas backup
+    emissions_gaz = gaz * facteur_gaz_tco2_mwh
+
+    # Emissions avoided vs "do nothing" (current ~175 MtCO2 from transport+buildings)
+    reference_emissions = 175.0  # MtCO2 from transport + buildings fossil
+    # Proportional to electrification progress (solar deployment as proxy)
+    progress = (solar - config.solaire_actuel_gwc) / (config.solaire_cible_gwc - config.solaire_actuel_gwc)
+    evitees_annuelles = np.maximum(0, reference_emissions * progress - emissions_gaz)
+
+    return {
+        'solaire_gwc': solar,
+        'solaire_ajout_gwc': solar_ajout,
+        'pac_fraction': pac,
+        'cout_solaire_eur_kw': cout_sol,
+        'cout_batterie_eur_kwh': cout_bat,
+        'gaz_backup_twh': gaz,
+        'invest_solaire_eur_b': invest_solaire,
+        'cout_gaz_annuel_eur_b': cout_gaz_annuel,
+        'cumul_invest_eur_b': np.cumsum(invest_solaire, axis=-1),
+        'emissions_gaz_mt': emissions_gaz,
+        'emissions_evitees_mt': evitees_annuelles,
+        'cumul_emissions_evitees_mt': np.cumsum(evitees_annuelles, axis=-1),
+    }
+
+
+# Decimals kept in each calculer_trajectoire metric
+_DECIMALES = {
+    'solaire_gwc': 1,
+    'solaire_ajout_gwc': 1,
+    'pac_fraction': 3,
+    'cout_solaire_eur_kw': 0,
+    'cout_batterie_eur_kwh': 0,
+    'gaz_backup_twh': 1,
+    'invest_solaire_eur_b': 1,
+    'cout_gaz_annuel_eur_b': 1,
+    'cumul_invest_eur_b': 1,
+    'emissions_gaz_mt': 1,
+    'emissions_evitees_mt': 1,
+    'cumul_emissions_evitees_mt': 0,
+}
+
+
 def calculer_trajectoire(
     config: Optional[TrajectoryConfig] = None,
 ) -> List[Dict]:
     """
     Calculate the full deployment trajectory year by year.
 
+    Every curve is evaluated over the whole year range at once with NumPy;
+    only the packaging of the per-year dicts loops in Python.
+
     Args:
         config: Trajectory configuration
 
@@ -249,62 +396,67 @@ def calculer_trajectoire(
         List of dicts, one per year, with all trajectory metrics
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
-    trajectory = []
-    cumul_invest_eur_b = 0.0
-    cumul_emissions_evitees_mt = 0.0
-    prev_solar = config.solaire_actuel_gwc
+    years = np.arange(config.annee_debut, config.annee_fin + 1)
+    courbes = _courbes_trajectoire(years, config)
 
-    # Reference: current gas use for sectors being electrified
-    # Transport: ~50 Mtep fossil → ~580 TWh; Buildings: ~40 Mtep → ~465 TWh
-    facteur_gaz_tco2_mwh = 0.227  # tCO2/MWh from emissions module
+    # One np.round per column rather than a round() call per value
+    colonnes = [np.round(valeurs, _DECIMALES[nom]).tolist() for nom, valeurs in courbes.items()]
+    return [
+        {'annee': year, **dict(zip(courbes, ligne))}
+        for year, *ligne in zip(years.tolist(), *colonnes)
+    ]
+
+
+def _champs_balayage(config: TrajectoryConfig, valeurs: Dict[str, np.ndarray]) -> SimpleNamespace:
+    """Config fields, with the swept ones replaced by float arrays over a trailing year axis."""
+    if valeurs.keys() & {'annee_debut', 'annee_fin'}:
+        raise TypeError("annee_debut and annee_fin set the year axis and cannot be swept")
+    c = champs_balayage(config, valeurs, axe_final=True)
+
+    # Derived constants of TrajectoryConfig.__post_init__, as arrays
+    c._solaire_s_bornes = tuple(
+        _logistique(c.solaire_steepness * (annee - c.solaire_midpoint))
+        for annee in (c.annee_debut, c.annee_fin))
+    c._pac_s_bornes = tuple(
+        _logistique(c.pac_steepness * (annee - c.pac_midpoint))
+        for annee in (c.annee_debut, c.annee_fin))
+    c._solaire_exposant = np.log2(1 - c.solaire_learning_rate)
+    c._batterie_exposant = np.log2(1 - c.batterie_learning_rate)
+    return c
+
+
+def calculer_trajectoire_sweep(
+    config: Optional[TrajectoryConfig] = None,
+    **valeurs,
+) -> Dict[str, np.ndarray]:
+    """
+    Deployment trajectories over arrays of parameter values, without configs.
+
+    Runs the calculer_trajectoire arithmetic once on broadcast arrays, for
+    batch scenario runs (e.g. Monte Carlo draws of deployment targets and
+    learning rates).
+
+    Args:
+        config: Trajectory configuration supplying the fields not swept
+            and the year range
+        **valeurs: TrajectoryConfig field name -> array of values
+            (annee_debut and annee_fin cannot be swept)
+
+    Returns:
+        'annee': the years, plus the calculer_trajectoire metrics unrounded,
+        each of shape (broadcast shape of the swept values) + (years,)
+    """
+    if config is None:
+        config = _DEFAULT
 
-    for year in range(config.annee_debut, config.annee_fin + 1):
-        solar = capacite_solaire_gwc(year, config)
-        pac = penetration_pac(year, config)
-        cout_sol = cout_solaire_eur_kw(year, config)
-        cout_bat = cout_batterie_eur_kwh(year, config)
-        gaz = gaz_backup_twh(solar, config)
-
-        # Annual solar additions
-        solar_ajout = solar - prev_solar
-        prev_solar = solar
-
-        # Annual investment: solar additions × cost
-        invest_solaire = solar_ajout * cout_sol / 1000  # €B (GWc × €/kW = €M, /1000 = €B)
-        cumul_invest_eur_b += invest_solaire
-
-        # Annual gas cost
-        cout_gaz_annuel = gaz * config.gaz_cout_eur_mwh / 1000  # €B
-
-        # Emissions from gas backup
-        emissions_gaz = gaz * facteur_gaz_tco2_mwh
-
-        # Emissions avoided vs "do nothing" (current ~175 MtCO2 from transport+buildings)
-        reference_emissions = 175.0  # MtCO2 from transport + buildings fossil
-        # Proportional to electrification progress (solar deployment as proxy)
-        progress = (solar - config.solaire_actuel_gwc) / (config.solaire_cible_gwc - config.solaire_actuel_gwc)
-        evitees_annuelles = reference_emissions * progress - emissions_gaz
-        cumul_emissions_evitees_mt += max(0, evitees_annuelles)
-
-        trajectory.append({
-            'annee': year,
-            'solaire_gwc': round(solar, 1),
-            'solaire_ajout_gwc': round(solar_ajout, 1),
-            'pac_fraction': round(pac, 3),
-            'cout_solaire_eur_kw': round(cout_sol, 0),
-            'cout_batterie_eur_kwh': round(cout_bat, 0),
-            'gaz_backup_twh': round(gaz, 1),
-            'invest_solaire_eur_b': round(invest_solaire, 1),
-            'cout_gaz_annuel_eur_b': round(cout_gaz_annuel, 1),
-            'cumul_invest_eur_b': round(cumul_invest_eur_b, 1),
-            'emissions_gaz_mt': round(emissions_gaz, 1),
-            'emissions_evitees_mt': round(max(0, evitees_annuelles), 1),
-            'cumul_emissions_evitees_mt': round(cumul_emissions_evitees_mt, 0),
-        })
-
-    return trajectory
+    variantes = _champs_balayage(config, valeurs)
+    years = np.arange(config.annee_debut, config.annee_fin + 1)
+    courbes = _courbes_trajectoire(years, variantes)
+    # Broadcast metrics that do not depend on the swept fields
+    forme = np.broadcast_shapes(*(c.shape for c in courbes.values()))
+    return {'annee': years, **{nom: np.broadcast_to(c, forme) for nom, c in courbes.items()}}
 
 
 def resume_trajectoire(config: Optional[TrajectoryConfig] = None) -> str:
@@ -320,13 +472,12 @@ def resume_trajectoire(config: Optional[TrajectoryConfig] = None) -> str:
         Formatted summary string
     """
     if config is None:
-        config = TrajectoryConfig()
+        config = _DEFAULT
 
     traj = calculer_trajectoire(config)
 
     # Key milestones
     milestones = [2024, 2030, 2035, 2040, 2045, 2050]
-    by_year = {t['annee']: t for t in traj}
 
     lines = [
         "Trajectoire de Déploiement 2024-2050",
@@ -337,8 +488,9 @@ def resume_trajectoire(config: Optional[TrajectoryConfig] = None) -> str:
     ]
 
     for year in milestones:
-        if year in by_year:
-            t = by_year[year]
+        # One row per year from annee_debut
+        if config.annee_debut <= year <= config.annee_fin:
+            t = traj[year - config.annee_debut]
             lines.append(
                 f"  {t['annee']:>5} {t['solaire_gwc']:>7.0f} {t['solaire_ajout_gwc']:>7.1f}"
                 f" {t['pac_fraction']:>5.0%} {t['cout_solaire_eur_kw']:>5.0f}"
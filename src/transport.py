@@ -17,6 +17,10 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 
+# Daily time slots, in chronological order
+_SLOT_KEYS = ('8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h')
+
+
 @dataclass
 class TransportConfig:
     """French transport sector energy parameters."""
@@ -448,8 +452,7 @@ def profil_recharge_normalise(
         config = TransportConfig()
 
     # Extract daily slot distribution from config
-    slot_keys = ['8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h']
-    daily_raw = [config.profil_recharge.get(k, 0.0) for k in slot_keys]
+    daily_raw = [config.profil_recharge.get(k, 0.0) for k in _SLOT_KEYS]
 
     # Normalize daily profile to sum to 1.0 (should already be ~1.0)
     daily_total = sum(daily_raw)
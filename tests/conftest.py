@@ -0,0 +1,31 @@
+"""Shared test data — time slots and a one-month (January) scenario.
+
+The df and solar_cf fixtures describe January only: 80 GW flat
+consumption, 60 GW flat non-solar production, and a capacity factor of
+0.2 on the two midday slots. Test modules needing another scenario
+define their own df fixture, which overrides this one.
+"""
+import pandas as pd
+import pytest
+
+PLAGES = ('8h-13h', '13h-18h', '18h-20h', '20h-23h', '23h-8h')
+DUREES = {'8h-13h': 5.0, '13h-18h': 5.0, '18h-20h': 2.0, '20h-23h': 3.0, '23h-8h': 9.0}
+
+
+@pytest.fixture
+def df():
+    """One month, 80 GW flat consumption, 60 GW flat non-solar production."""
+    return pd.DataFrame([{
+        'Mois': 'Janvier', 'Plage': plage,
+        'Production_kW': 60e6, 'Consommation_kW': 80e6,
+        'Deficit_kW': 20e6, 'Duree_h': DUREES[plage],
+    } for plage in PLAGES])
+
+
+@pytest.fixture
+def solar_cf():
+    """Capacity factor 0.2 on the two midday slots, 0 elsewhere by day."""
+    cf = {'8h-13h': 0.2, '13h-18h': 0.2, '18h-20h': 0.0, '20h-23h': 0.0}
+    return {('Janvier', plage): {'cf': cf[plage], 'base_prod': 60e6,
+                                 'conso': 80e6, 'duree': DUREES[plage]}
+            for plage in cf}
@@ -220,6 +220,23 @@ def test_synthesis_store_accepts_19_columns():
     assert data[0]['h2_electrolyse_kw'] == 99.0
 
 
+def test_synthesis_columns_follow_slot_order():
+    """load_synthesis_columns() aligns each column with the requested slots."""
+    from src.database.store import EnergyModelDB
+    with EnergyModelDB(":memory:") as db:
+        assert db.load_synthesis_columns([('Janvier', '8h-13h')]) == {}
+        db.store_synthesis([
+            ('Février', '8h-13h') + (2.0,) * 17,
+            ('Janvier', '8h-13h') + (1.0,) * 17,
+        ])
+        cols = db.load_synthesis_columns(
+            [('Janvier', '8h-13h'), ('Janvier', '13h-18h'), ('Février', '8h-13h')]
+        )
+    assert cols['pv_maisons_kw'] == [1.0, 0.0, 2.0]
+    assert cols['h2_electrolyse_kw'] == [1.0, 0.0, 2.0]
+    assert 'mois' not in cols
+
+
 def test_synthesis_h2_electrolyse_kw_value():
     """H2 electrolyse kW from balance should be ~15.3 million kW (134 TWh / 8760h)."""
     from src.consumption import calculate_system_balance
@@ -0,0 +1,155 @@
+"""Tests for the ODS writer — round-trip through odfpy's loader."""
+import zipfile
+
+from odf.opendocument import load
+from odf.table import Table, TableRow, TableCell
+from odf.teletype import extractText
+
+from src.ods_generator.writer import BLANK_CELL, ODSWriter
+
+
+def _load_rows(path, sheet):
+    doc = load(str(path))
+    for table in doc.spreadsheet.getElementsByType(Table):
+        if table.getAttribute('name') == sheet:
+            return doc, [row.getElementsByType(TableCell)
+                         for row in table.getElementsByType(TableRow)]
+    raise KeyError(sheet)
+
+
+class TestDataSheet:
+    def test_roundtrip_values(self, tmp_path):
+        writer = ODSWriter()
+        writer.add_data_sheet(
+            'donnees', ['Mois', 'Valeur'],
+            [('Janvier', 1.5), ('Février', 2)],
+            title='Titre <test> & co',
+        )
+        path = tmp_path / 'out.ods'
+        writer.save(str(path))
+
+        _, rows = _load_rows(path, 'donnees')
+        assert len(rows) == 4  # title + header + 2 data rows
+        assert extractText(rows[0][0]) == 'Titre <test> & co'
+        assert [extractText(c) for c in rows[1]] == ['Mois', 'Valeur']
+        assert rows[2][1].getAttribute('valuetype') == 'float'
+        assert rows[2][1].getAttribute('value') == '1.5'
+        assert extractText(rows[2][1]) == ''  # displayed via the num2 data style
+        assert extractText(rows[3][0]) == 'Février'
+
+    def test_styles_kept_without_dom_cells(self, tmp_path):
+        """Styles used only by a serialized data sheet are still written."""
+        writer = ODSWriter()
+        writer.add_data_sheet('donnees', ['A'], [(1.0,), ('x',)], title='T')
+        path = tmp_path / 'out.ods'
+        writer.save(str(path))
+
+        doc, _ = _load_rows(path, 'donnees')
+        names = {s.getAttribute('name') for s in doc.automaticstyles.childNodes}
+        assert {'title', 'header', 'number', 'text', 'num2'} <= names
+
+    def test_store_compression(self, tmp_path):
+        writer = ODSWriter()
+        writer.add_data_sheet('donnees', ['A'], [(1.0,)])
+        path = tmp_path / 'out.ods'
+        writer.save(str(path), compression='store')
+
+        with zipfile.ZipFile(path) as zf:
+            assert {i.compress_type for i in zf.infolist()} == {zipfile.ZIP_STORED}
+        _, rows = _load_rows(path, 'donnees')
+        assert rows[1][0].getAttribute('value') == '1.0'
+
+
+class TestFormulaSheet:
+    def test_roundtrip_formula_cells(self, tmp_path):
+        writer = ODSWriter()
+        table = writer.add_formula_sheet('calc', ['Nom', 'Valeur'], title='Calc')
+        writer.add_formula_row(table, [
+            {'value': 'total'},
+            {'value': 3.0, 'formula': 'of:=[.B4]+[.B5]'},
+        ])
+        writer.add_formula_row(table, [
+            {'value': 'TOTAL', 'style': 'total'},
+            {'value': None},
+        ])
+        path = tmp_path / 'out.ods'
+        writer.save(str(path))
+
+        doc, rows = _load_rows(path, 'calc')
+        assert len(rows) == 4
+        cell = rows[2][1]
+        assert cell.getAttribute('formula') == 'of:=[.B4]+[.B5]'
+        assert cell.getAttribute('value') == '3.0'
+        assert cell.getAttribute('stylename') == 'formula'
+        assert rows[3][0].getAttribute('stylename') == 'total'
+        assert extractText(rows[3][1]) == ''
+        names = {s.getAttribute('name') for s in doc.automaticstyles.childNodes}
+        assert {'formula', 'total', 'text'} <= names
+
+    def test_blank_cell_is_bare(self, tmp_path):
+        writer = ODSWriter()
+        table = writer.add_formula_sheet('calc', ['A', 'B'])
+        writer.add_formula_row(table, [{'value': 'x'}, BLANK_CELL])
+        assert table.rows[-1].endswith('<table:table-cell/></table:table-row>')
+
+        path = tmp_path / 'out.ods'
+        writer.save(str(path))
+        _, rows = _load_rows(path, 'calc')
+        assert extractText(rows[1][1]) == ''
+        assert rows[1][1].getAttribute('valuetype') is None
+
+    def test_repeated_cell(self):
+        writer = ODSWriter()
+        table = writer.add_formula_sheet('calc', ['A', 'B', 'C', 'D'])
+        writer.add_formula_row(table, [{'value': 'x'}, {'value': None, 'repeat': 3}])
+        assert 'table:number-columns-repeated="3"' in table.rows[-1]
+
+    def test_emitters_match_add_formula_row(self):
+        writer = ODSWriter()
+        table = writer.add_formula_sheet('calc', ['A', 'B', 'C'])
+        writer.add_formula_row(table, [
+            {'value': 'a & b'},
+            {'value': 2.5, 'formula': 'of:=[.B3]*2'},
+            {'value': 5.0},
+        ])
+        row = []
+        writer.emit_text(row, 'a & b')
+        writer.emit_formula_float(row, 2.5, 'of:=[.B3]*2')
+        writer.emit_float(row, 5.0)
+        writer.add_row(table, row)
+        assert table.rows[-1] == table.rows[-2]
+
+    def test_data_sheet_matches_formula_rows_without_default_styles(self):
+        writer = ODSWriter()
+        writer._s_number = writer._s_text = None
+        data = writer.add_data_sheet('donnees', ['A', 'B'], [('x', 1.5)])
+        table = writer.add_formula_sheet('calc', ['A', 'B'])
+        writer.add_formula_row(table, [{'value': 'x'}, {'value': 1.5}])
+        assert 'style-name' not in table.rows[-1]
+        assert ''.join(data.rows) == ''.join(table.rows)
+
+
+class TestSheetCache:
+    def test_identical_content_reuses_cached_xml(self, tmp_path):
+        cache = tmp_path / 'cache'
+        rows = [('Janvier', 1.0), ('Février', 2.0)]
+
+        first = ODSWriter(cache_dir=str(cache))
+        first.add_data_sheet('donnees', ['Mois', 'Valeur'], rows, title='T')
+        assert len(list(cache.glob('ods_donnees_*.xml'))) == 1
+
+        second = ODSWriter(cache_dir=str(cache))
+        second.add_data_sheet('donnees', ['Mois', 'Valeur'], rows, title='T')
+        assert second.sheets['donnees'].rows == first.sheets['donnees'].rows
+        assert len(list(cache.glob('ods_donnees_*.xml'))) == 1
+
+    def test_changed_content_misses_cache(self, tmp_path):
+        cache = tmp_path / 'cache'
+        ODSWriter(cache_dir=str(cache)).add_data_sheet('donnees', ['A'], [(1.0,)])
+        ODSWriter(cache_dir=str(cache)).add_data_sheet('donnees', ['A'], [(2.0,)])
+        assert len(list(cache.glob('ods_donnees_*.xml'))) == 2
+
+    def test_no_temp_files_left_behind(self, tmp_path):
+        cache = tmp_path / 'cache'
+        ODSWriter(cache_dir=str(cache)).add_data_sheet('donnees', ['A'], [(1.0,)])
+        assert [p.suffix for p in cache.iterdir()] == ['.xml']
@@ -0,0 +1,100 @@
+"""Tests for production module — base extraction, capacity factors, anomalies."""
+import pandas as pd
+import pytest
+
+from src.config import EnergyModelConfig
+from src.production import (
+    NightSlot,
+    extract_base_production,
+    extract_night_data,
+    calculate_solar_capacity_factors,
+    scale_production,
+    detect_production_anomalies,
+)
+from tests.conftest import DUREES, PLAGES
+
+
+@pytest.fixture
+def df():
+    """Two months: 50 GW base at night, solar on top during the day."""
+    rows = []
+    for mois, base in (('Janvier', 60e6), ('Juin', 40e6)):
+        for plage in PLAGES:
+            solar = {'8h-13h': 100e6, '13h-18h': 80e6, '18h-20h': 10e6,
+                     '20h-23h': 0.0, '23h-8h': 0.0}[plage]
+            rows.append({
+                'Mois': mois, 'Plage': plage,
+                'Production_kW': base + solar, 'Consommation_kW': 90e6,
+                'Duree_h': DUREES[plage],
+            })
+    return pd.DataFrame(rows)
+
+
+class TestBaseProduction:
+    def test_night_production_per_month(self, df):
+        assert extract_base_production(df) == {'Janvier': 60e6, 'Juin': 40e6}
+
+
+class TestNightData:
+    def test_night_slot_per_month(self, df):
+        night = extract_night_data(df)
+        assert list(night) == ['Janvier', 'Juin']
+        assert night['Janvier'] == NightSlot(production_kw=60e6, consommation_kw=90e6,
+                                             deficit_kw=30e6, duree_h=9.0)
+
+
+class TestCapacityFactors:
+    def test_day_slots_only(self, df):
+        cf = calculate_solar_capacity_factors(df, extract_base_production(df))
+        assert len(cf) == 8
+        assert ('Janvier', '23h-8h') not in cf
+
+    def test_cf_is_solar_over_capacity(self, df):
+        config = EnergyModelConfig()
+        cf = calculate_solar_capacity_factors(df, extract_base_production(df), config)
+        data = cf[('Janvier', '8h-13h')]
+        assert data['cf'] == pytest.approx(100e6 / 500e6)
+        assert data['base_prod'] == 60e6
+        assert data['conso'] == 90e6
+        assert data['duree'] == 5.0
+
+    def test_cf_never_negative(self, df):
+        cf = calculate_solar_capacity_factors(df, {'Janvier': 200e6, 'Juin': 200e6})
+        assert all(d['cf'] == 0 for d in cf.values())
+
+    def test_scale_production_doubles_solar(self, df):
+        cf = calculate_solar_capacity_factors(df, extract_base_production(df))
+        scaled = scale_production(cf, 1000)
+        data = scaled[('Janvier', '8h-13h')]
+        assert data['solar_kw'] == pytest.approx(200e6)
+        assert data['production_kw'] == pytest.approx(260e6)
+        assert data['deficit_kw'] == 0
+        assert data['surplus_kw'] == pytest.approx(170e6)
+
+
+class TestAnomalies:
+    def test_no_anomalies_in_plausible_data(self, df):
+        assert len(detect_production_anomalies(df)) == 0
+
+    def test_evening_production_in_winter_flagged(self, df):
+        df.loc[(df['Mois'] == 'Janvier') & (df['Plage'] == '20h-23h'), 'Production_kW'] = 150e6
+        anomalies = detect_production_anomalies(df)
+        assert len(anomalies) == 1
+        row = anomalies.iloc[0]
+        assert (row['Mois'], row['Plage']) == ('Janvier', '20h-23h')
+        assert row['Fraction_soleil'] == 0.0
+        assert row['Ecart_GW'] == pytest.approx(150 - 65)
+
+
+class TestCategoricalInput:
+    def test_same_results_as_strings(self, df):
+        """Mois/Plage as categoricals (as loaded from ODS) change nothing."""
+        cat = df.astype({'Mois': 'category', 'Plage': 'category'})
+        cat.loc[1, 'Production_kW'] = df.loc[1, 'Production_kW'] = 400e6
+        assert extract_base_production(cat) == extract_base_production(df)
+        base = extract_base_production(df)
+        assert (calculate_solar_capacity_factors(cat, base)
+                == calculate_solar_capacity_factors(df, base))
+        anomalies = detect_production_anomalies(df).to_dict('records')
+        assert len(anomalies) == 1
+        assert detect_production_anomalies(cat).to_dict('records') == anomalies
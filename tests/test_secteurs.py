@@ -0,0 +1,94 @@
+"""Tests for secteurs module — industry/tertiary balances."""
+from dataclasses import fields
+
+import numpy as np
+import pytest
+
+from src.secteurs import (
+    IndustrieConfig,
+    TertiaireConfig,
+    bilan_industrie,
+    bilan_industrie_sweep,
+    bilan_tertiaire,
+    bilan_tertiaire_sweep,
+    bilan_tous_secteurs,
+    resume_secteurs,
+)
+
+
+def _empiler(configs):
+    """Each config field stacked across configs, as sweep keyword arguments."""
+    return {f.name: [getattr(c, f.name) for c in configs] for f in fields(configs[0])}
+
+
+class TestConfigList:
+    def test_industrie_configs_match_scalar(self):
+        configs = [IndustrieConfig(), IndustrieConfig(gain_efficacite_fraction=0.3),
+                   IndustrieConfig(moyenne_temp_cop=4.0)]
+        batch = bilan_industrie_sweep(**_empiler(configs))
+        for i, config in enumerate(configs):
+            for key, value in bilan_industrie(config).items():
+                assert batch[key][i] == pytest.approx(value)
+
+    def test_tertiaire_configs_match_scalar(self):
+        configs = [TertiaireConfig(), TertiaireConfig(chauffage_twh=100.0)]
+        batch = bilan_tertiaire_sweep(**_empiler(configs))
+        for i, config in enumerate(configs):
+            for key, value in bilan_tertiaire(config).items():
+                assert batch[key][i] == pytest.approx(value)
+
+
+class TestDefaultBalances:
+    def test_default_matches_explicit_config(self):
+        assert dict(bilan_industrie()) == bilan_industrie(IndustrieConfig())
+        assert dict(bilan_tertiaire()) == bilan_tertiaire(TertiaireConfig())
+
+    def test_default_is_read_only(self):
+        with pytest.raises(TypeError):
+            bilan_industrie()['total_elec_twh'] = -1.0
+
+    @pytest.mark.parametrize('bilan', [
+        lambda: bilan_industrie(IndustrieConfig(autres_twh=20.0)),
+        lambda: bilan_tertiaire(TertiaireConfig(autres_twh=3.0)),
+        lambda: bilan_tous_secteurs(),
+    ])
+    def test_all_balances_read_only(self, bilan):
+        with pytest.raises(TypeError):
+            bilan()['total_elec_twh'] = -1.0
+
+
+class TestBilanTousSecteurs:
+    def test_precomputed_balances_match_configs(self):
+        ind_cfg = IndustrieConfig(autres_twh=20.0)
+        ter_cfg = TertiaireConfig(autres_twh=3.0)
+        attendu = bilan_tous_secteurs(ind_cfg, ter_cfg)
+        assert bilan_tous_secteurs(
+            ind=bilan_industrie(ind_cfg), ter=bilan_tertiaire(ter_cfg)) == attendu
+
+
+class TestResume:
+    def test_gain_percentage_follows_config(self):
+        assert "(-15%)" in resume_secteurs()
+        assert "(-30%)" in resume_secteurs(IndustrieConfig(gain_efficacite_fraction=0.3))
+
+
+class TestSweep:
+    def test_sweep_matches_scalar(self):
+        cops = [2.0, 2.5, 4.0]
+        sweep = bilan_industrie_sweep(moyenne_temp_cop=cops)
+        for i, cop in enumerate(cops):
+            attendu = bilan_industrie(IndustrieConfig(moyenne_temp_cop=cop))
+            assert sweep['total_elec_twh'][i] == pytest.approx(attendu['total_elec_twh'])
+
+    def test_sweep_broadcasts_grid(self):
+        gains, fossile = np.meshgrid([0.2, 0.3, 0.5], [0.4, 0.6])
+        sweep = bilan_tertiaire_sweep(renovation_gain_chauffage=gains,
+                                      chauffage_fossile_fraction=fossile)
+        assert sweep['total_elec_twh'].shape == (2, 3)
+        attendu = bilan_tertiaire(TertiaireConfig(renovation_gain_chauffage=0.5,
+                                                  chauffage_fossile_fraction=0.4))
+        assert sweep['total_elec_twh'][0, 2] == pytest.approx(attendu['total_elec_twh'])
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(TypeError):
+            bilan_industrie_sweep(cop=[3.0])
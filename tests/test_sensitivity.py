@@ -0,0 +1,66 @@
+"""Tests for sensitivity module — gas need vs solar capacity."""
+import pytest
+
+from src.config import EnergyModelConfig
+from src.sensitivity import (
+    calculate_gas_need_no_storage,
+    calculate_gas_need_with_storage,
+    find_zero_gas_capacity,
+    run_sensitivity_analysis,
+)
+
+JOURS = EnergyModelConfig().temporal.jours_par_mois
+
+
+def _twh(gw, heures):
+    return gw * 1e6 * heures * JOURS / 1e9
+
+
+class TestNoStorage:
+    def test_zero_solar_keeps_every_deficit(self, df, solar_cf):
+        config = EnergyModelConfig()
+        extra = -config.production.solar_capacity_gwc
+        gas = calculate_gas_need_no_storage(extra, solar_cf, df, config)
+        assert gas == pytest.approx(_twh(20, 24))
+
+    def test_solar_covers_midday_only(self, df, solar_cf):
+        config = EnergyModelConfig()
+        # 100 GWc at cf 0.2 fills the 20 GW midday gap exactly
+        extra = 100 - config.production.solar_capacity_gwc
+        gas = calculate_gas_need_no_storage(extra, solar_cf, df, config)
+        assert gas == pytest.approx(_twh(20, 2 + 3 + 9))
+
+
+class TestWithStorage:
+    def test_storage_shifts_midday_surplus(self, df, solar_cf):
+        config = EnergyModelConfig()
+        # 200 GWc: 20 GW surplus over 10 h midday
+        extra = 200 - config.production.solar_capacity_gwc
+        gas = calculate_gas_need_with_storage(extra, solar_cf, df, config)
+        surplus = _twh(20, 10) * config.storage.battery_efficiency
+        assert gas == pytest.approx(_twh(20, 14) - surplus)
+
+
+class TestSensitivityAnalysis:
+    def test_matches_point_calculations(self, df, solar_cf):
+        config = EnergyModelConfig()
+        result = run_sensitivity_analysis(df, solar_cf, [-400, 0, 300], config)
+        for row in result.itertuples():
+            assert row.gas_no_storage_twh == pytest.approx(
+                calculate_gas_need_no_storage(row.extra_solar_gwc, solar_cf, df, config))
+            assert row.gas_with_storage_twh == pytest.approx(
+                calculate_gas_need_with_storage(row.extra_solar_gwc, solar_cf, df, config))
+            assert row.storage_benefit_twh >= 0
+
+
+class TestZeroGasCapacity:
+    def test_storage_reaches_zero_gas(self, df, solar_cf):
+        # 0.85 * (0.2 C - 20 GW) * 10 h >= 20 GW * 14 h  <=>  C >= 264.7 GWc
+        config = EnergyModelConfig()
+        assert find_zero_gas_capacity(
+            df, solar_cf, config, with_storage=True, tolerance_twh=0.0) == 265
+
+    def test_night_deficit_never_reached_without_storage(self, df, solar_cf):
+        config = EnergyModelConfig()
+        capacity = find_zero_gas_capacity(df, solar_cf, config, with_storage=False)
+        assert capacity == config.production.solar_capacity_gwc + 1000
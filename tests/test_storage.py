@@ -0,0 +1,39 @@
+"""Tests for storage module — daily storage requirement."""
+import pytest
+
+from src.config import EnergyModelConfig
+from src.production import extract_night_data
+from src.sensitivity import calculate_gas_need_with_storage
+from src.storage import (
+    calculate_daily_balance,
+    calculate_storage_by_month,
+    calculate_storage_need,
+)
+
+
+class TestStorageNeed:
+    def test_min_of_daily_surplus_and_deficit(self, df, solar_cf):
+        config = EnergyModelConfig()
+        # 200 GWc: 20 GW surplus over 10 h, 20 GW deficit over 14 h
+        extra = 200 - config.production.solar_capacity_gwc
+        assert calculate_storage_need(extra, solar_cf, df, config) == pytest.approx(200.0)
+
+    def test_by_month_covers_every_month(self, df, solar_cf):
+        config = EnergyModelConfig()
+        extra = 400 - config.production.solar_capacity_gwc
+        by_month = calculate_storage_by_month(extra, solar_cf, df, config)
+        assert list(by_month) == list(config.temporal.mois_ordre)
+        # 400 GWc: 60 GW surplus over 10 h exceeds the 280 GWh deficit
+        assert by_month['Janvier'] == pytest.approx(280.0)
+        assert by_month['Juin'] == 0.0
+
+
+class TestDailyBalance:
+    def test_shared_balance_matches_separate_calls(self, df, solar_cf):
+        config = EnergyModelConfig()
+        extra = 200 - config.production.solar_capacity_gwc
+        balance = calculate_daily_balance(extra, solar_cf, extract_night_data(df), config)
+        assert calculate_storage_need(extra, solar_cf, df, config, balance=balance) == \
+            calculate_storage_need(extra, solar_cf, df, config)
+        assert calculate_gas_need_with_storage(extra, solar_cf, df, config, balance=balance) == \
+            calculate_gas_need_with_storage(extra, solar_cf, df, config)
@@ -0,0 +1,69 @@
+"""Tests for tarification module — steady-state pricing."""
+import numpy as np
+import pytest
+
+from src.tarification import (
+    TarificationConfig,
+    analyse_sensibilite_tarif,
+    calcul_tarification,
+    comparaison_cout_consommateur,
+    cout_production_annuel,
+    flux_financiers,
+    tarif_equilibre_eur_mwh,
+    tarif_equilibre_sweep,
+)
+
+
+class TestCache:
+    def test_same_config_returns_same_read_only_result(self):
+        config = TarificationConfig(gaz_twh=80.0)
+        tarif = tarif_equilibre_eur_mwh(config)
+        assert tarif_equilibre_eur_mwh(TarificationConfig(gaz_twh=80.0)) is tarif
+        with pytest.raises(TypeError):
+            tarif['total_ttc_eur_mwh'] = 0.0
+
+    def test_config_is_frozen(self):
+        with pytest.raises(AttributeError):
+            TarificationConfig().gaz_twh = 0.0
+
+    def test_default_matches_explicit_config(self):
+        assert cout_production_annuel() == cout_production_annuel(TarificationConfig())
+
+
+class TestSensibilite:
+    def test_variants_keep_other_fields_of_config(self):
+        config = TarificationConfig(gaz_twh=50.0)
+        gaz = analyse_sensibilite_tarif(config)['gaz_lcoe']
+        haut = TarificationConfig(gaz_twh=50.0, gaz_lcoe_eur_mwh=config.gaz_lcoe_eur_mwh * 1.2)
+        assert gaz['high_eur_mwh'] == pytest.approx(
+            tarif_equilibre_eur_mwh(haut)['total_ttc_eur_mwh'])
+
+    def test_system_cost_parameter_moves_tariff(self):
+        reseau = analyse_sensibilite_tarif()['reseau']
+        # +/-20% of 15 EUR B over 729 TWh
+        assert reseau['impact_eur_mwh'] == pytest.approx(0.2 * 15.0 * 1000 / 729.0)
+
+
+class TestCalculTarification:
+    def test_matches_individual_functions(self):
+        config = TarificationConfig(gaz_twh=60.0, reseau_cout_annuel_eur_b=18.0)
+        res = calcul_tarification(config)
+        assert res.tarif == tarif_equilibre_eur_mwh(config)
+        assert res.flux == flux_financiers(config)
+        assert res.comp == comparaison_cout_consommateur(config)
+        assert res.sensib == analyse_sensibilite_tarif(config)
+
+
+class TestSweep:
+    def test_sweep_matches_scalar(self):
+        base = TarificationConfig(hydro_twh=70.0)
+        gaz, lcoe = np.meshgrid([60.0, 114.0], [90.0, 120.0, 150.0])
+        sweep = tarif_equilibre_sweep(base, gaz_twh=gaz, gaz_lcoe_eur_mwh=lcoe)
+        assert sweep['total_ttc_eur_mwh'].shape == (3, 2)
+        attendu = tarif_equilibre_eur_mwh(
+            TarificationConfig(hydro_twh=70.0, gaz_twh=60.0, gaz_lcoe_eur_mwh=150.0))
+        assert sweep['total_ttc_eur_mwh'][2, 0] == attendu['total_ttc_eur_mwh']
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(TypeError):
+            tarif_equilibre_sweep(gaz=[1.0])
@@ -0,0 +1,74 @@
+"""Tests for temporal module — period parsing and solar availability."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config import EnergyModelConfig
+from src.temporal import (
+    PLAGE_CODES,
+    est_plage_nocturne,
+    est_plage_nocturne_vectorisee,
+    extraire_mois,
+    extraire_plage,
+    fraction_solaire_attendue,
+    fraction_solaire_df,
+    fraction_solaire_vectorisee,
+    parse_periode,
+)
+
+
+class TestExtraireMois:
+    @pytest.mark.parametrize('periode, mois', [
+        ("Janvier 8 heures - 13 heures", 'Janvier'),
+        ("fevrier 23 heures - 8 heures", 'Février'),
+        ("DÉCEMBRE 18 heures - 20 heures", 'Décembre'),
+        ("Aout 13 heures - 18 heures", 'Août'),
+        ("Total annuel", 'Inconnu'),
+    ])
+    def test_month_names(self, periode, mois):
+        assert extraire_mois(periode) == mois
+
+
+class TestParsePeriode:
+    @pytest.mark.parametrize('periode', [
+        "Janvier 8 heures - 13 heures",
+        "Juin 18 heures - 20 heures",
+        "Décembre 23 heures - 8 heures",
+        "Total annuel",
+    ])
+    def test_matches_single_purpose_functions(self, periode):
+        assert parse_periode(periode) == (extraire_mois(periode), extraire_plage(periode))
+
+
+class TestFractionSolaireVectorisee:
+    def test_matches_scalar_over_sunset_range(self):
+        config = EnergyModelConfig()
+        sunsets = np.linspace(16.0, 24.0, 33)
+        codes = np.array(list(PLAGE_CODES.values()) + [-1])
+        grille = fraction_solaire_vectorisee(sunsets[:, np.newaxis], codes)
+        for i, sunset in enumerate(sunsets):
+            config.temporal.sunset_times['Juin'] = sunset
+            for j, plage in enumerate([*PLAGE_CODES, 'Autre']):
+                assert grille[i, j] == fraction_solaire_attendue('Juin', plage, config)
+
+
+class TestPlageNocturneVectorisee:
+    def test_matches_scalar_for_every_month(self):
+        config = EnergyModelConfig()
+        sunset_times = config.temporal.sunset_times
+        sunsets = np.array([sunset_times[mois] for mois in config.temporal.mois_ordre])
+        codes = np.array(list(PLAGE_CODES.values()) + [-1])
+        grille = est_plage_nocturne_vectorisee(sunsets[:, np.newaxis], codes)
+        for i, mois in enumerate(config.temporal.mois_ordre):
+            for j, plage in enumerate([*PLAGE_CODES, 'Autre']):
+                assert grille[i, j] == est_plage_nocturne(mois, plage, config)
+
+
+class TestFractionSolaireDf:
+    def test_matches_per_row_calls(self):
+        df = pd.DataFrame({
+            'mois': ['Janvier', 'Avril', 'Juin', 'Inconnu', 'Avril'],
+            'plage': ['18h-20h', '20h-23h', '8h-13h', '18h-20h', 'Autre'],
+        })
+        attendu = [fraction_solaire_attendue(m, p) for m, p in zip(df['mois'], df['plage'])]
+        assert fraction_solaire_df(df, 'mois', 'plage').tolist() == attendu
@@ -0,0 +1,82 @@
+"""Tests for trajectory module — deployment path 2024-2050."""
+from dataclasses import replace
+import math
+
+import numpy as np
+import pytest
+
+from src.trajectory import (
+    TrajectoryConfig,
+    calculer_trajectoire,
+    calculer_trajectoire_sweep,
+    capacite_solaire_gwc,
+    cout_batterie_eur_kwh,
+    cout_solaire_eur_kw,
+    gaz_backup_twh,
+    penetration_pac,
+)
+
+
+class TestCalculerTrajectoire:
+    @pytest.mark.parametrize('config', [
+        TrajectoryConfig(),
+        TrajectoryConfig(annee_debut=2030, solaire_cible_gwc=800.0, gaz_b=50.0),
+    ])
+    def test_matches_per_year_functions(self, config):
+        traj = calculer_trajectoire(config)
+        assert [t['annee'] for t in traj] == list(range(config.annee_debut, config.annee_fin + 1))
+        prev = config.solaire_actuel_gwc
+        for t in traj:
+            year = t['annee']
+            solar = capacite_solaire_gwc(year, config)
+            assert t['solaire_gwc'] == round(solar, 1)
+            assert t['solaire_ajout_gwc'] == round(solar - prev, 1)
+            assert t['pac_fraction'] == round(penetration_pac(year, config), 3)
+            assert t['cout_solaire_eur_kw'] == round(cout_solaire_eur_kw(year, config), 0)
+            assert t['cout_batterie_eur_kwh'] == round(cout_batterie_eur_kwh(year, config), 0)
+            assert t['gaz_backup_twh'] == round(gaz_backup_twh(solar, config), 1)
+            prev = solar
+
+    def test_steep_curve_saturates_instead_of_overflowing(self):
+        config = TrajectoryConfig(solaire_steepness=100.0)
+        traj = calculer_trajectoire(config)
+        assert [t['solaire_gwc'] for t in traj] == [
+            round(capacite_solaire_gwc(t['annee'], config), 1) for t in traj]
+
+    def test_far_future_midpoint_stays_finite(self):
+        # Both S-curve bounds deep in the lower tail: tiny but distinct
+        config = TrajectoryConfig(solaire_midpoint=2100, solaire_steepness=1.0)
+        solar = capacite_solaire_gwc(2030, config)
+        assert math.isfinite(solar)
+        assert config.solaire_actuel_gwc < solar < config.solaire_actuel_gwc + 1e-3
+        for t in calculer_trajectoire(config):
+            assert all(math.isfinite(v) for v in t.values())
+
+    def test_cumulative_totals_never_decrease(self):
+        traj = calculer_trajectoire()
+        for prev, cur in zip(traj, traj[1:]):
+            assert cur['cumul_emissions_evitees_mt'] >= prev['cumul_emissions_evitees_mt']
+            assert cur['cumul_invest_eur_b'] >= prev['cumul_invest_eur_b']
+
+
+class TestSweep:
+    def test_matches_per_config_functions(self):
+        steepness = [0.2, 0.35, 0.8]
+        learning = [0.1, 0.2, 0.3]
+        sweep = calculer_trajectoire_sweep(solaire_steepness=steepness,
+                                           solaire_learning_rate=learning)
+        assert sweep['solaire_gwc'].shape == (3, 27)
+        assert sweep['cout_batterie_eur_kwh'].shape == (3, 27)
+        for i, (k, lr) in enumerate(zip(steepness, learning)):
+            config = replace(TrajectoryConfig(), solaire_steepness=k, solaire_learning_rate=lr)
+            for j, year in enumerate(sweep['annee']):
+                assert sweep['solaire_gwc'][i, j] == pytest.approx(capacite_solaire_gwc(year, config))
+                assert sweep['cout_solaire_eur_kw'][i, j] == pytest.approx(cout_solaire_eur_kw(year, config))
+            final = calculer_trajectoire(config)[-1]
+            assert sweep['cumul_invest_eur_b'][i, -1] == pytest.approx(final['cumul_invest_eur_b'], abs=0.05)
+
+    def test_unknown_or_year_fields_rejected(self):
+        with pytest.raises(TypeError):
+            calculer_trajectoire_sweep(solaire_cible=np.ones(2))
+        with pytest.raises(TypeError):
+            calculer_trajectoire_sweep(annee_fin=[2040, 2050])